@@ -1,4 +1,9 @@
 # Assuming you have not changed the general structure of the template no modification is needed in this file.
+import time
+
+# Taken before any other import so the logged load time includes importing the commands.
+_load_start = time.perf_counter()
+
 from . import commands
 from .lib import fusion360utils as futil
 
@@ -8,6 +13,9 @@ def run(context):
         # This will run the start function in each of your commands as defined in commands/__init__.py
         commands.start()
 
+        elapsed = (time.perf_counter() - _load_start) * 1000
+        futil.log(f'Add-in loaded in {elapsed:.1f} ms')
+
     except:
         futil.handle_error('run')
 
@@ -3,11 +3,18 @@
 # Import printable bolt create module
 # If you want to add an additional command, duplicate one of the existing directories and import it here.
 # You need to use aliases (import "entry" as "my_module") assuming you have the default module named "entry".
+# Entry modules should only hold the lightweight command metadata needed to create the button,
+# importing their command logic inside command_created so it is not loaded while Fusion starts.
 from .printableBoltCreate import entry as printableBoltCreate
+from .printableBoltEdit import entry as printableBoltEdit
+from .printableBoltBatch import entry as printableBoltBatch
+from ..lib import fusion360utils as futil
 
 # Add the spur gear create module to list so it will be started and stopped.
 commands = [
-    printableBoltCreate
+    printableBoltCreate,
+    printableBoltEdit,
+    printableBoltBatch
 ]
 
 
@@ -15,7 +22,8 @@ commands = [
 # The start function will be run when the add-in is started.
 def start():
     for command in commands:
-        command.start()
+        with futil.timed(f'{command.__name__} start()'):
+            command.start()
 
 
 # Assumes you defined a "stop" function in each of your modules.
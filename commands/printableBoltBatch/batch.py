@@ -0,0 +1,245 @@
+# Builds many printable bolts without blocking Fusion. A worker thread reads the specs and computes everything that
+# doesn't need the Fusion API, the unique specs, the layout and the meshes of threads Fusion can't model. The Fusion
+# API may only be used from the main thread, so the worker queues its results and fires a custom event whose handler
+# builds a few bolts and then fires the event again, letting Fusion handle input and repaint between chunks.
+
+import adsk.core, adsk.fusion
+import json
+import math
+import queue
+import threading
+import time
+
+from ...lib import fusion360utils as futil
+from ...lib.boltgeometry import bom
+from ...lib.boltgeometry.spec import is_standard_thread, thread_mesh
+from ... import config
+from ..printableBoltCreate.printable_bolt import PrintableBolt
+
+CUSTOM_EVENT_ID = f'{config.COMPANY_NAME}_{config.ADDIN_NAME}_printableBoltBatchReady'
+
+# The number of bolts built per custom event, small enough for Fusion to stay responsive in between.
+CHUNK_SIZE = 4
+
+# The gap between bolts laid out in the grid, relative to the widest bolt of the batch.
+GRID_SPACING_RATIO = 1.5
+
+# The job that is running, Fusion only allows one handler chain per custom event id.
+activeJob: 'BatchJob' = None
+
+
+# Files read as BOMs rather than lists of specs.
+BOM_EXTENSIONS = ('.csv', '.xlsx', '.xlsm')
+
+
+class BatchItem:
+    def __init__(self, index: int, spec: dict, specHash: str, threadRidges, positions):
+        self.index = index
+        self.spec = spec
+        self.specHash = specHash
+        # The thread mesh of a bolt whose thread Fusion can't model, None otherwise.
+        self.threadRidges = threadRidges
+        # The (x, y) positions of the bolt and its instances in cm.
+        self.positions = positions
+
+
+def loadSpecs(path: str, backlash: float):
+    # Reads the unique specs of a BOM or of a JSON list of bolt specs, in the form stored on printable bolt
+    # components, and the lines of a BOM that name no fastener size. Repeated specs are built once.
+    if path.lower().endswith(BOM_EXTENSIONS):
+        return bom.bom_specs(path, backlash)
+
+    with open(path, encoding='utf-8') as specFile:
+        specs = json.load(specFile)
+    if not isinstance(specs, list) or not all(isinstance(spec, dict) for spec in specs):
+        raise ValueError(f'{path} does not contain a list of bolt specs.')
+    return bom.unique_specs((spec, 1, index) for index, spec in enumerate(specs)), []
+
+
+def gridPositions(uniqueSpecs):
+    # Lays every instance out on a square grid in the XY plane, spaced by the widest bolt. Returns the
+    # positions per unique spec.
+    width = max(max(unique.spec.get('headDiameter', 0.0), unique.spec['bodyDiameter']) for unique in uniqueSpecs)
+    spacing = width * GRID_SPACING_RATIO
+    count = sum(unique.quantity for unique in uniqueSpecs)
+    columns = max(1, math.ceil(math.sqrt(count)))
+
+    positions = []
+    index = 0
+    for unique in uniqueSpecs:
+        positions.append([((i % columns) * spacing, (i // columns) * spacing) for i in range(index, index + unique.quantity)])
+        index += unique.quantity
+    return positions
+
+
+class BatchJob:
+    def __init__(self, ui: adsk.core.UserInterface, app: adsk.core.Application, path: str, buildMode: str,
+                 backlash: float = 0.0):
+        self.ui = ui
+        self.app = app
+        self.path = path
+        self.buildMode = buildMode
+        # The backlash of bolts read from a BOM, spec files carry their own.
+        self.backlash = backlash
+
+        # Messages from the worker: ('total', (unique specs, instances)), ('skipped', lines), ('item', BatchItem),
+        # ('error', message) and ('done', None).
+        self.results = queue.Queue()
+        self.cancelled = threading.Event()
+        self.worker = threading.Thread(target=self.compute, name='PrintableBoltBatch', daemon=True)
+
+        self.handlers = []
+        self.progressDialog = None
+        self.total = 0
+        self.instances = 0
+        self.built = 0
+        self.placed = 0
+        self.failed = 0
+        self.skipped = []
+        self.finished = False
+        self.summary = ''
+        self.startTime = None
+
+    def run(self):
+        global activeJob
+        activeJob = self
+        self.startTime = time.perf_counter()
+
+        customEvent = self.app.registerCustomEvent(CUSTOM_EVENT_ID)
+        futil.add_handler(customEvent, self.onResults, local_handlers=self.handlers)
+
+        self.progressDialog = self.ui.createProgressDialog()
+        self.progressDialog.isCancelButtonShown = True
+        self.progressDialog.show('Printable Bolt Batch', 'Reading bolt specs...', 0, 1, 0)
+
+        self.worker.start()
+
+    def cancel(self):
+        # Stops the worker, the bolts that were already built are kept.
+        self.cancelled.set()
+        if not self.finished:
+            self.finish()
+
+    def compute(self):
+        # Runs on the worker thread, so nothing in here may touch the Fusion API other than fireCustomEvent.
+        try:
+            uniqueSpecs, skipped = loadSpecs(self.path, self.backlash)
+            uniqueSpecs = [unique for unique in uniqueSpecs if unique.quantity > 0]
+            positions = gridPositions(uniqueSpecs) if uniqueSpecs else []
+            self.results.put(('total', (len(uniqueSpecs), sum(unique.quantity for unique in uniqueSpecs))))
+            if skipped:
+                self.results.put(('skipped', skipped))
+
+            for index, unique in enumerate(uniqueSpecs):
+                if self.cancelled.is_set():
+                    return
+
+                spec = dict(unique.spec, buildMode=self.buildMode)
+                # The same rule as PrintableBolt.resolveThreadData, threads in the thread table are modeled by Fusion.
+                threadRidges = None if is_standard_thread(spec) else thread_mesh(spec)
+                self.results.put(('item', BatchItem(index, spec, unique.spec_hash, threadRidges, positions[index])))
+
+                if (index + 1) % CHUNK_SIZE == 0:
+                    self.app.fireCustomEvent(CUSTOM_EVENT_ID)
+
+            self.results.put(('done', None))
+
+        except Exception as e:
+            self.results.put(('error', f'{type(e).__name__}: {e}'))
+
+        self.app.fireCustomEvent(CUSTOM_EVENT_ID)
+
+    def onResults(self, args: adsk.core.CustomEventArgs):
+        # Runs on the main thread, builds up to CHUNK_SIZE of the queued bolts.
+        if self.finished:
+            return
+
+        try:
+            self.buildChunk()
+        except:
+            # Anything failing outside a single bolt ends the job, otherwise it would block every later batch.
+            futil.handle_error('Printable Bolt Batch')
+            if not self.finished:
+                self.finish()
+                self.ui.messageBox(f'The batch stopped unexpectedly.\n{self.summary}', 'Printable Bolt Batch')
+
+    def buildChunk(self):
+        built = 0
+        while built < CHUNK_SIZE:
+            if self.progressDialog.wasCancelled:
+                self.cancel()
+                return
+
+            try:
+                kind, payload = self.results.get_nowait()
+            except queue.Empty:
+                return
+
+            if kind == 'total':
+                self.total, self.instances = payload
+                self.progressDialog.maximumValue = max(1, self.total)
+                self.progressDialog.message = 'Building bolt size %v of %m...'
+            elif kind == 'skipped':
+                self.skipped = payload
+                futil.log(f'Printable Bolt Batch skipped {len(payload)} lines without a fastener size: {payload}')
+            elif kind == 'item':
+                try:
+                    self.build(payload)
+                except:
+                    self.failed += 1
+                    futil.handle_error(f'Printable Bolt Batch {payload.spec.get("boltName")}')
+                self.progressDialog.progressValue = payload.index + 1
+                built += 1
+            elif kind == 'error':
+                self.finish()
+                self.ui.messageBox(f'The batch could not be read.\n{payload}', 'Printable Bolt Batch')
+                return
+            elif kind == 'done':
+                self.finish()
+                self.ui.messageBox(self.summary, 'Printable Bolt Batch')
+                return
+
+        # More results may be waiting, hand control back to Fusion before building them.
+        self.app.fireCustomEvent(CUSTOM_EVENT_ID)
+
+    def build(self, item: BatchItem):
+        printable_bolt = PrintableBolt(self.ui, self.app)
+        printable_bolt.applySpec(item.spec)
+        printable_bolt.threadRidges = item.threadRidges
+
+        printable_bolt.transform = self.transform(item.positions[0])
+
+        component = printable_bolt.buildBolt('batch')
+        if component is None:
+            self.failed += 1
+            return
+
+        # The other instances of the spec share the component instead of being built again.
+        occurrences = adsk.fusion.Design.cast(self.app.activeProduct).rootComponent.occurrences
+        for position in item.positions[1:]:
+            occurrences.addExistingComponent(component, self.transform(position))
+            self.placed += 1
+        self.built += 1
+
+    def transform(self, position):
+        transform = adsk.core.Matrix3D.create()
+        transform.translation = adsk.core.Vector3D.create(position[0], position[1], 0)
+        return transform
+
+    def finish(self):
+        global activeJob
+        self.finished = True
+        self.cancelled.set()
+        if activeJob is self:
+            activeJob = None
+
+        self.progressDialog.hide()
+        self.app.unregisterCustomEvent(CUSTOM_EVENT_ID)
+        self.handlers = []
+
+        elapsed = time.perf_counter() - self.startTime
+        self.summary = (f'Built {self.built} of {self.total} bolt sizes and placed {self.placed} more instances '
+                        f'in {elapsed:.1f} s, {self.failed} failed.')
+        if self.skipped:
+            self.summary += f'\n{len(self.skipped)} lines named no fastener size and were skipped.'
+        futil.log(f'Printable Bolt Batch: {self.summary}')
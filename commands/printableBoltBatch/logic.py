@@ -0,0 +1,96 @@
+import adsk.core
+import adsk.fusion
+import os
+
+from ..printableBoltCreate.printable_bolt import BUILD_MODE_PARAMETRIC, BUILD_MODE_DIRECT
+from . import batch
+
+app = adsk.core.Application.get()
+ui = app.userInterface
+skipValidate = False
+
+
+class PrintableBoltBatchLogic():
+    def __init__(self, des: adsk.fusion.Design):
+        self.design = des
+
+        self.path = ''
+        self.backlash = '0.01'
+
+        defaultUnits = des.unitsManager.defaultLengthUnits
+
+        # Show the values in inches or millimeters, matching the create command.
+        if defaultUnits == 'in' or defaultUnits == 'ft':
+            self.units = 'in'
+        else:
+            self.units = 'mm'
+
+        # Batches default to direct bolts, hundreds of parametric bolts make every later recompute slow.
+        self.buildMode = BUILD_MODE_DIRECT
+
+    def CreateCommandInputs(self, inputs: adsk.core.CommandInputs):
+        global skipValidate
+        skipValidate = True
+
+        # Create the command inputs to define the contents of the command dialog.
+        self.pathTextInput = inputs.addTextBoxCommandInput('path', 'Spec or BOM File', self.path, 2, True)
+        self.browseButtonInput = inputs.addBoolValueInput('browse', 'Select File...', False, '', False)
+
+        # BOMs list fastener sizes only, so the printer tolerance is set here.
+        self.backlashValueInput = inputs.addValueInput('backlash', 'BOM Backlash', self.units, adsk.core.ValueInput.createByReal(float(self.backlash)))
+        self.backlashValueInput.tooltip = 'The backlash of bolts read from a BOM, bolt spec files carry their own.'
+
+        self.buildModeDropDownInput = inputs.addDropDownCommandInput('buildMode', 'Build Mode', adsk.core.DropDownStyles.TextListDropDownStyle)
+        self.buildModeDropDownInput.listItems.add('Parametric', self.buildMode == BUILD_MODE_PARAMETRIC)
+        self.buildModeDropDownInput.listItems.add('Direct (Fast)', self.buildMode == BUILD_MODE_DIRECT)
+
+        self.errorMessageTextInput = inputs.addTextBoxCommandInput('errMessage', '', '', 2, True)
+        self.errorMessageTextInput.isFullWidth = True
+
+        skipValidate = False
+
+    def HandleValidateInputs(self, args: adsk.core.ValidateInputsEventArgs):
+        if not skipValidate:
+            self.errorMessageTextInput.text = ''
+
+            if not os.path.isfile(self.path):
+                args.areInputsValid = False
+                return
+
+            # Backlash >= 0
+            if not float(self.backlashValueInput.value) >= 0:
+                self.errorMessageTextInput.text = 'The backlash value cannot be negative.'
+                args.areInputsValid = False
+                return
+
+            # Only one batch can run at a time.
+            if batch.activeJob is not None:
+                self.errorMessageTextInput.text = 'A batch is still running.'
+                args.areInputsValid = False
+                return
+
+    def HandleInputsChanged(self, args: adsk.core.InputChangedEventArgs):
+        changedInput = args.input
+
+        if not skipValidate:
+            if changedInput.id == 'browse':
+                fileDialog = ui.createFileDialog()
+                fileDialog.title = 'Select Bolt Specs or a BOM'
+                fileDialog.filter = 'Bolt Specs and BOMs (*.json *.csv *.xlsx);;Bolt Specs (*.json);;BOMs (*.csv *.xlsx)'
+                if fileDialog.showOpen() == adsk.core.DialogResults.DialogOK:
+                    self.path = fileDialog.filename
+                    self.pathTextInput.text = self.path
+
+    def HandleExecute(self, args: adsk.core.CommandEventArgs):
+        # The job keeps running after the command has finished, see batch.BatchJob.
+        job = batch.BatchJob(ui, app, self.path, self.SelectedBuildMode(), float(self.backlashValueInput.value))
+        job.run()
+
+    def CancelBatch(self):
+        if batch.activeJob is not None:
+            batch.activeJob.cancel()
+
+    def SelectedBuildMode(self):
+        if self.buildModeDropDownInput.selectedItem.name == 'Direct (Fast)':
+            return BUILD_MODE_DIRECT
+        return BUILD_MODE_PARAMETRIC
@@ -2,12 +2,13 @@ import adsk.core
 import os
 from ...lib import fusion360utils as futil
 from ... import config
-from . import logic
 
-app = adsk.core.Application.get()
-ui = app.userInterface
+# The application and the command logic are only fetched once they are needed, see start()
+# and command_created(), so loading the add-in stays cheap while Fusion is starting.
+app: adsk.core.Application = None
+ui: adsk.core.UserInterface = None
 
-printable_bolt_logic: logic.PrintableBoltLogic = None
+printable_bolt_logic: 'logic.PrintableBoltLogic' = None
 
 # Specify the command identity information.
 CMD_ID = f'{config.COMPANY_NAME}_{config.ADDIN_NAME}_printableBoltCreate'
@@ -35,6 +36,10 @@ local_handlers = []
 # Executed when the add-in is loaded. The button to execute the command
 # is created and the event handler to handle when the command is run is connected.
 def start():
+    global app, ui
+    app = adsk.core.Application.get()
+    ui = app.userInterface
+
     # General logging for debug.
     futil.log(f'{CMD_NAME} started')
 
@@ -118,6 +123,9 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
     if des is None:
         return
 
+    # Import the command logic on first use rather than when the add-in is loaded.
+    from . import logic
+
     # Create an instance of the Printable Bolt command class.
     global printable_bolt_logic
     printable_bolt_logic = logic.PrintableBoltLogic(des)
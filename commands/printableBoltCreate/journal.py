@@ -0,0 +1,169 @@
+# A local journal of bolt builds, one JSON record per line, used to see how long builds take and which specs fail.
+# This module has no Fusion imports so the journal can also be queried from a terminal:
+#
+#     python journal.py [path] [--slowest N]
+
+import json
+import math
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+
+class BuildRecord:
+    def __init__(self, event: str, specHash: str, spec: dict):
+        self.record = {
+            'time':      time.time(),
+            'event':     event,
+            'specHash':  specHash,
+            'spec':      spec,
+            'stages':    {},
+            'features':  0,
+            'bodies':    0,
+            'triangles': None,
+            'thread':    None,
+            'outcome':   None,
+            'error':     None,
+            'duration':  None,
+        }
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        # Times a stage of the build, a stage entered more than once accumulates.
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stages = self.record['stages']
+            stages[name] = stages.get(name, 0.0) + time.perf_counter() - start
+
+    def finish(self, error: BaseException = None):
+        self.record['duration'] = time.perf_counter() - self._start
+        self.record['outcome'] = 'error' if error is not None else 'success'
+        self.record['error'] = type(error).__name__ if error is not None else None
+        return self.record
+
+
+def append(path: str, record: dict, maxBytes: int, backups: int):
+    # Appends a record, first rotating path to path.1, path.1 to path.2 and so on once it is larger than maxBytes.
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    if os.path.exists(path) and os.path.getsize(path) >= maxBytes:
+        for index in range(backups - 1, 0, -1):
+            if os.path.exists(f'{path}.{index}'):
+                os.replace(f'{path}.{index}', f'{path}.{index + 1}')
+        if backups > 0:
+            os.replace(path, f'{path}.1')
+        else:
+            os.remove(path)
+
+    # A line cut short by a crash has no newline, the record mustn't be glued onto it.
+    separator = ''
+    if os.path.exists(path) and os.path.getsize(path) > 0:
+        with open(path, 'rb') as journalFile:
+            journalFile.seek(-1, os.SEEK_END)
+            if journalFile.read(1) != b'\n':
+                separator = '\n'
+
+    with open(path, 'a', encoding='utf-8') as journalFile:
+        journalFile.write(separator + json.dumps(record, sort_keys=True) + '\n')
+
+
+def read(path: str, backups: int = 0):
+    # Yields the records of a journal, oldest first, including its rotated backups.
+    paths = [f'{path}.{index}' for index in range(backups, 0, -1)] + [path]
+    for journalPath in paths:
+        if not os.path.exists(journalPath):
+            continue
+        with open(journalPath, encoding='utf-8') as journalFile:
+            for line in journalFile:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # A line cut short by a crash while it was written.
+                    continue
+
+
+def percentile(values, fraction: float):
+    # Nearest rank percentile of a list of numbers.
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def summarize(records, slowest: int = 10):
+    # Returns a text report of the build durations per event and stage, the failures and the slowest specs.
+    records = list(records)
+    lines = [f'{len(records)} builds']
+
+    events = sorted({record['event'] for record in records})
+    for event in events:
+        eventRecords = [record for record in records if record['event'] == event]
+        durations = [record['duration'] for record in eventRecords if record['duration'] is not None]
+        failures = sum(1 for record in eventRecords if record['outcome'] != 'success')
+        lines.append('')
+        lines.append(f'{event}: {len(eventRecords)} builds, {failures} failed')
+        lines.append(formatPercentiles('total', durations))
+
+        stages = sorted({name for record in eventRecords for name in record['stages']})
+        for name in stages:
+            lines.append(formatPercentiles(name, [record['stages'][name] for record in eventRecords if name in record['stages']]))
+
+    errors = {}
+    for record in records:
+        if record['outcome'] != 'success':
+            errors.setdefault(record['error'], set()).add(record['specHash'])
+    if errors:
+        lines.append('')
+        lines.append('failures:')
+        for error, specHashes in sorted(errors.items(), key=lambda item: str(item[0])):
+            lines.append(f'  {error}: {", ".join(sorted(specHashes))}')
+
+    # The slowest specs by their slowest build.
+    worst = {}
+    for record in records:
+        if record['duration'] is None:
+            continue
+        current = worst.get(record['specHash'])
+        if current is None or record['duration'] > current['duration']:
+            worst[record['specHash']] = record
+    if worst:
+        lines.append('')
+        lines.append(f'slowest {min(slowest, len(worst))} specs:')
+        for record in sorted(worst.values(), key=lambda record: record['duration'], reverse=True)[:slowest]:
+            lines.append(f'  {record["specHash"]}  {record["duration"] * 1000:9.1f} ms  {record["event"]}  {json.dumps(record["spec"], sort_keys=True)}')
+
+    return '\n'.join(lines)
+
+
+def formatPercentiles(name: str, durations):
+    if not durations:
+        return f'  {name:<12} -'
+    p50, p90, p99 = (percentile(durations, fraction) * 1000 for fraction in (0.5, 0.9, 0.99))
+    return f'  {name:<12} p50 {p50:9.1f} ms  p90 {p90:9.1f} ms  p99 {p99:9.1f} ms  max {max(durations) * 1000:9.1f} ms'
+
+
+def main(argv):
+    import argparse
+
+    # The same default as config.JOURNAL_PATH, which isn't importable when this runs as a script.
+    defaultPath = os.path.join(os.path.expanduser('~'), '.printable_bolt', 'builds.jsonl')
+
+    parser = argparse.ArgumentParser(description='Print build time percentiles and the slowest specs from a printable bolt journal.')
+    parser.add_argument('path', nargs='?', default=defaultPath, help='The journal file, defaults to ~/.printable_bolt/builds.jsonl.')
+    parser.add_argument('--backups', type=int, default=3, help='The number of rotated journal files to include.')
+    parser.add_argument('--slowest', type=int, default=10, help='The number of slowest specs to list.')
+    args = parser.parse_args(argv)
+
+    print(summarize(read(args.path, args.backups), args.slowest))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -5,7 +5,9 @@ import os
 import json
 import time
 
-from .printable_bolt import PrintableBolt
+from .printable_bolt import PrintableBolt, BUILD_MODE_PARAMETRIC, BUILD_MODE_DIRECT
+from ...lib.boltgeometry import head_profiles, mesh
+from ...lib.boltgeometry.spec import thread_pitch
 
 app = adsk.core.Application.get()
 ui = app.userInterface
@@ -50,16 +52,25 @@ class PrintableBoltLogic():
 
         self.backlash = '0.01'
 
+        # A pitch of 0 uses the pitch recommended for the shaft diameter.
+        self.pitch = '0'
+        self.threadStarts = 1
+        self.threadAngle = '60'
+
         self.headHeight = '0.5'
         self.headDiameter = '2.0'
 
         self.headNumSides = '6'
+        self.headProfile = head_profiles.DEFAULT_HEAD_PROFILE
 
         self.threadChamferDistance = '0.04'
         # TODO: Make configurable
         self.baseFilleted = True
 
         self.headless = False
+        self.useParameters = False
+        self.buildMode = BUILD_MODE_PARAMETRIC
+        self.fastPreview = False
         # TODO: Re-add head chamfer
         # self.headChamfered = False
 
@@ -81,10 +92,21 @@ class PrintableBoltLogic():
 
         self.backlashValueInput = inputs.addValueInput('backlash', 'Backlash', self.units, adsk.core.ValueInput.createByReal(float(self.backlash)))
 
+        self.pitchValueInput = inputs.addValueInput('pitch', 'Thread Pitch', self.units, adsk.core.ValueInput.createByReal(float(self.pitch)))
+        self.pitchValueInput.tooltip = 'The distance between neighbouring thread ridges, 0 uses the standard pitch for the shaft diameter.'
+        self.threadStartsInput = inputs.addIntegerSpinnerCommandInput('threadStarts', 'Thread Starts', 1, 8, 1, self.threadStarts)
+        self.threadAngleValueInput = inputs.addValueInput('threadAngle', 'Thread Angle', 'deg', adsk.core.ValueInput.createByString(f'{self.threadAngle} deg'))
+        self.threadAngleValueInput.tooltip = 'The included angle between the thread flanks. Threads other than single start 60 degree standard threads are added as a mesh.'
+
         self.headDiameterValueInput = inputs.addValueInput('headDiameter', 'Head Diameter', self.units, adsk.core.ValueInput.createByReal(float(self.headDiameter)))
         self.headHeightValueInput = inputs.addValueInput('headHeight', 'Head Height', self.units, adsk.core.ValueInput.createByReal(float(self.headHeight)))
 
+        self.headProfileDropDownInput = inputs.addDropDownCommandInput('headProfile', 'Head Type', adsk.core.DropDownStyles.TextListDropDownStyle)
+        for name in head_profiles.HEAD_PROFILES:
+            self.headProfileDropDownInput.listItems.add(name, name == self.headProfile)
+
         self.headNumSidesInput = inputs.addStringValueInput('headNumSides', 'Head Number of Sides', str(self.headNumSides))
+        self.headNumSidesInput.isVisible = head_profiles.HEAD_PROFILES[self.headProfile].sides == 0
 
         self.threadChamferDistanceValueInput = inputs.addValueInput('threadChamferDistance', 'Thread Chamfer Distance', self.units, adsk.core.ValueInput.createByReal(float(self.threadChamferDistance)))
         self.baseFilletedBoolValueInput = inputs.addBoolValueInput('baseFilleted', 'Base Filleted', True, '', self.baseFilleted == True)
@@ -92,6 +114,19 @@ class PrintableBoltLogic():
         self.headlessBoolValueInput = inputs.addBoolValueInput('headless', 'Headless', True, '', self.headless == True)
         # self.headChamferedBoolValueInput = inputs.addBoolValueInput('headChamfered', 'Head Chamfered', True, '', self.headChamfered == True)
 
+        self.useParametersBoolValueInput = inputs.addBoolValueInput('useParameters', 'Drive With User Parameters', True, '', self.useParameters == True)
+        self.useParametersBoolValueInput.tooltip = 'Bind the bolt dimensions to user parameters so it can be resized with Edit Printable Bolt.'
+
+        self.buildModeDropDownInput = inputs.addDropDownCommandInput('buildMode', 'Build Mode', adsk.core.DropDownStyles.TextListDropDownStyle)
+        self.buildModeDropDownInput.listItems.add('Parametric', self.buildMode == BUILD_MODE_PARAMETRIC)
+        self.buildModeDropDownInput.listItems.add('Direct (Fast)', self.buildMode == BUILD_MODE_DIRECT)
+        self.buildModeDropDownInput.tooltip = 'Direct builds the head and shaft as a single base feature without history, followed only by the thread, which keeps recomputes of large designs fast.'
+
+        self.fastPreviewBoolValueInput = inputs.addBoolValueInput('fastPreview', 'Fast Preview', True, '', self.fastPreview == True)
+        self.fastPreviewBoolValueInput.tooltip = 'Preview the bolt as a lightweight mesh instead of building its features.'
+
+        self.threadReportTextInput = inputs.addTextBoxCommandInput('threadReport', 'Thread', '', 1, True)
+
         self.errorMessageTextInput = inputs.addTextBoxCommandInput('errMessage', '', '', 2, True)
         self.errorMessageTextInput.isFullWidth = True
 
@@ -124,6 +159,27 @@ class PrintableBoltLogic():
                 args.areInputsValid = False
                 return
 
+            # Pitch >= 0, 0 uses the standard pitch
+            if not float(self.pitchValueInput.value) >= 0:
+                self.errorMessageTextInput.text = 'The thread pitch cannot be negative.'
+                args.areInputsValid = False
+                return
+
+            # Thread angle between 30 and 120 degrees
+            if not 30 <= math.degrees(self.threadAngleValueInput.value) <= 120:
+                self.errorMessageTextInput.text = 'The thread angle must be between 30 and 120 degrees.'
+                args.areInputsValid = False
+                return
+
+            # Thread depth < shaft radius, coarse pitches and narrow angles cut deeper
+            shaftDiameter = float(self.shaftDiameterValueInput.value)
+            pitch = thread_pitch({'bodyDiameter': shaftDiameter, 'pitch': self.SelectedPitch()})
+            root, _, _ = mesh.thread_profile(shaftDiameter, pitch, 0.0, math.degrees(self.threadAngleValueInput.value))
+            if not root > 0:
+                self.errorMessageTextInput.text = 'The thread is deeper than the shaft radius, use a finer pitch or a wider thread angle.'
+                args.areInputsValid = False
+                return
+
             # Validations that should only happen if a head is desired:
             if bool(self.headlessBoolValueInput.value) == False:
                 # Head height > 0
@@ -145,7 +201,7 @@ class PrintableBoltLogic():
                     return
 
                 # Head number of sides > 2 and a whole number
-                if not self.headNumSidesInput.value.isdigit() or int(self.headNumSidesInput.value) <= 2:
+                if self.headNumSidesInput.isVisible and (not self.headNumSidesInput.value.isdigit() or int(self.headNumSidesInput.value) <= 2):
                     self.errorMessageTextInput.text = 'The number of sides must be a whole number greater than 2.'
                     args.areInputsValid = False
                     return
@@ -160,10 +216,19 @@ class PrintableBoltLogic():
                 elif self.standardDropDownInput.selectedItem.name == 'Metric':
                     self.units = 'mm'
 
+            # Direct bolts have no dimensions that user parameters could drive.
+            if changedInput.id == 'buildMode':
+                self.useParametersBoolValueInput.isVisible = self.SelectedBuildMode() == BUILD_MODE_PARAMETRIC
+
+            # Only polygon heads take their number of sides from the dialog.
+            if changedInput.id == 'headProfile':
+                self.headNumSidesInput.isVisible = self.SelectedHeadProfile().sides == 0
+
             if changedInput.id == 'headless':
                 if bool(self.headlessBoolValueInput.value) == True:
                     self.headDiameterValueInput.isVisible = False
                     self.headHeightValueInput.isVisible = False
+                    self.headProfileDropDownInput.isVisible = False
                     self.headNumSidesInput.isVisible = False
                     # self.headChamferedBoolValueInput.isVisible = False
 
@@ -171,7 +236,8 @@ class PrintableBoltLogic():
                 else:
                     self.headDiameterValueInput.isVisible = True
                     self.headHeightValueInput.isVisible = True
-                    self.headNumSidesInput.isVisible = True
+                    self.headProfileDropDownInput.isVisible = True
+                    self.headNumSidesInput.isVisible = self.SelectedHeadProfile().sides == 0
                     # self.headChamferedBoolValueInput.isVisible = True
 
                     self.baseFilletedBoolValueInput.isVisible = True
@@ -188,6 +254,8 @@ class PrintableBoltLogic():
             self.threadChamferDistanceValueInput.unitType = self.units
             self.backlashValueInput.value = self.backlashValueInput.value
             self.backlashValueInput.unitType = self.units
+            self.pitchValueInput.value = self.pitchValueInput.value
+            self.pitchValueInput.unitType = self.units
             self.headDiameterValueInput.value = self.headDiameterValueInput.value
             self.headDiameterValueInput.unitType = self.units
             self.headHeightValueInput.value = self.headHeightValueInput.value
@@ -202,7 +270,8 @@ class PrintableBoltLogic():
         printable_bolt.headDiameter = float(self.headDiameterValueInput.value)
         printable_bolt.headHeight = float(self.headHeightValueInput.value)
 
-        printable_bolt.headSides = int(self.headNumSidesInput.value) if not self.headlessBoolValueInput.value else 0
+        printable_bolt.headSides = self.SelectedHeadSides() if not self.headlessBoolValueInput.value else 0
+        printable_bolt.headProfile = self.SelectedHeadProfile().name
 
         printable_bolt.chamferDistance = adsk.core.ValueInput.createByReal(float(self.threadChamferDistanceValueInput.value))
 
@@ -211,7 +280,18 @@ class PrintableBoltLogic():
 
         printable_bolt.backlash = adsk.core.ValueInput.createByReal(float(self.backlashValueInput.value))
 
-        printable_bolt.buildBolt()
+        printable_bolt.pitch = self.SelectedPitch()
+        printable_bolt.threadStarts = self.threadStartsInput.value
+        printable_bolt.threadAngle = math.degrees(self.threadAngleValueInput.value)
+
+        printable_bolt.buildMode = self.SelectedBuildMode()
+
+        self.threadReportTextInput.text = printable_bolt.threadReport()
+
+        if bool(self.fastPreviewBoolValueInput.value):
+            printable_bolt.buildPreviewGraphics()
+        else:
+            printable_bolt.buildBolt('preview')
 
     def HandleExecute(self, args: adsk.core.CommandEventArgs):
         printable_bolt = PrintableBolt(ui, app)
@@ -222,7 +302,8 @@ class PrintableBoltLogic():
         printable_bolt.headDiameter = float(self.headDiameterValueInput.value)
         printable_bolt.headHeight = float(self.headHeightValueInput.value)
 
-        printable_bolt.headSides = int(self.headNumSidesInput.value) if not self.headlessBoolValueInput.value else 0
+        printable_bolt.headSides = self.SelectedHeadSides() if not self.headlessBoolValueInput.value else 0
+        printable_bolt.headProfile = self.SelectedHeadProfile().name
 
         printable_bolt.chamferDistance = adsk.core.ValueInput.createByReal(float(self.threadChamferDistanceValueInput.value))
 
@@ -231,4 +312,26 @@ class PrintableBoltLogic():
 
         printable_bolt.backlash = adsk.core.ValueInput.createByReal(float(self.backlashValueInput.value))
 
-        printable_bolt.buildBolt()
\ No newline at end of file
+        printable_bolt.pitch = self.SelectedPitch()
+        printable_bolt.threadStarts = self.threadStartsInput.value
+        printable_bolt.threadAngle = math.degrees(self.threadAngleValueInput.value)
+
+        printable_bolt.buildMode = self.SelectedBuildMode()
+        printable_bolt.useParameters = bool(self.useParametersBoolValueInput.value) and printable_bolt.buildMode == BUILD_MODE_PARAMETRIC
+
+        printable_bolt.buildBolt()
+
+    def SelectedBuildMode(self):
+        if self.buildModeDropDownInput.selectedItem.name == 'Direct (Fast)':
+            return BUILD_MODE_DIRECT
+        return BUILD_MODE_PARAMETRIC
+
+    def SelectedPitch(self):
+        pitch = float(self.pitchValueInput.value)
+        return pitch if pitch > 0 else None
+
+    def SelectedHeadProfile(self):
+        return head_profiles.HEAD_PROFILES[self.headProfileDropDownInput.selectedItem.name]
+
+    def SelectedHeadSides(self):
+        return self.SelectedHeadProfile().sides or int(self.headNumSidesInput.value)
@@ -1,5 +1,147 @@
-import adsk.core, adsk.fusion, traceback, math
+import adsk.core, adsk.fusion, traceback, math, json, re, time
 from ...lib import fusion360utils as futil
+from ...lib.boltgeometry import head_profiles, mesh, thread_table
+from ...lib.boltgeometry.spec import spec_hash, is_recommended_thread, thread_pitch, thread_mesh, thread_triangle_count
+from ... import config
+from . import journal
+
+# Attribute group and name used to store the spec a bolt was built from on its component.
+SPEC_ATTRIBUTE_GROUP = 'PrintableBolt'
+SPEC_ATTRIBUTE_NAME  = 'spec'
+
+# Dimensions that can be bound to design user parameters, in the order they are created.
+PARAMETER_NAMES = ['headDiameter', 'headHeight', 'bodyDiameter', 'bodyLength', 'backlash']
+
+# Dimensions the thread is generated from, left unbound for mesh threads that can't be recomputed.
+THREAD_PARAMETER_NAMES = ['bodyDiameter', 'bodyLength', 'backlash']
+
+# Parametric bolts are built from sketches and features, direct bolts from a single temporary B-rep
+# base feature which keeps the timeline short for bolts that never need their history. The temporary
+# B-rep manager has no helix, so a direct bolt with a modeled thread still adds the thread and its
+# offset after the base feature, three timeline entries in all.
+BUILD_MODE_PARAMETRIC = 'parametric'
+BUILD_MODE_DIRECT     = 'direct'
+
+
+def realValue(value):
+    # Some bolt properties are plain floats and others are ValueInputs, this returns the float for either.
+    if isinstance(value, adsk.core.ValueInput):
+        return value.realValue
+    return value
+
+
+# Standard thread data per (thread type, diameter, pitch). The thread data query is slow and batches of
+# bolts keep asking for the same few sizes.
+_threadDataCache = {}
+
+
+# Seconds the thread stage of a build last took per spec hash, read from the journal on first use and kept up to
+# date by the builds of this session.
+_threadStageTimes = None
+
+# Seconds per triangle of generating a thread mesh, measured once to estimate threads that weren't built yet.
+_secondsPerThreadTriangle = None
+
+
+def threadStageTimes():
+    global _threadStageTimes
+    if _threadStageTimes is None:
+        _threadStageTimes = {}
+        # Only the current journal file is read, the backups would make the first preview slow.
+        if config.JOURNAL_ENABLED:
+            try:
+                for record in journal.read(config.JOURNAL_PATH):
+                    if record.get('outcome') == 'success' and 'thread' in record.get('stages', {}):
+                        _threadStageTimes[record['specHash']] = record['stages']['thread']
+            except:
+                futil.handle_error('Printable Bolt journal')
+    return _threadStageTimes
+
+
+def secondsPerThreadTriangle():
+    global _secondsPerThreadTriangle
+    if _secondsPerThreadTriangle is None:
+        start = time.perf_counter()
+        ridges = mesh.thread(1.0, 0.15, 1.0, -1.0, segments_per_turn=mesh.EXPORT_THREAD_SEGMENTS)
+        _secondsPerThreadTriangle = (time.perf_counter() - start) / ridges.triangle_count
+    return _secondsPerThreadTriangle
+
+
+# The thread type of inch specs, the thread data query has no default for it.
+INCH_THREAD_TYPE = 'ANSI Unified Screw Threads'
+
+
+def threadTypeOf(threadDataQuery: adsk.fusion.ThreadDataQuery, standard):
+    # Returns the thread type of a spec thread standard, or None if Fusion has no thread data for it.
+    if standard == 'English':
+        return INCH_THREAD_TYPE if INCH_THREAD_TYPE in threadDataQuery.allThreadTypes else None
+    return threadDataQuery.defaultMetricThreadType
+
+
+def queryThreadData(threadDataQuery: adsk.fusion.ThreadDataQuery, threadType, diameter, pitch=None):
+    # Returns the (designation, class) of the standard thread for a diameter, with the given pitch in cm
+    # or the recommended one, or None if the thread type has no such thread.
+    key = (threadType, round(diameter, 6), None if pitch is None else round(pitch, 6))
+    if key not in _threadDataCache:
+        _threadDataCache[key] = lookupThreadData(threadDataQuery, threadType, diameter, pitch)
+    return _threadDataCache[key]
+
+
+def lookupThreadData(threadDataQuery: adsk.fusion.ThreadDataQuery, threadType, diameter, pitch):
+    recommendData = threadDataQuery.recommendThreadData(diameter, False, threadType)
+    if not recommendData[0]:
+        return None
+    if pitch is None:
+        return recommendData[1], recommendData[2]
+
+    # Look through the designations of the nearest size for the pitch, e.g. M10x1.25 next to M10x1.5
+    # or 1/4-28 UNF next to 1/4-20 UNC.
+    sizes = {}
+    for size in threadDataQuery.allSizes(threadType):
+        sizeDiameter = threadSizeDiameter(threadType, size)
+        if sizeDiameter is not None:
+            sizes[size] = sizeDiameter
+    if not sizes:
+        return None
+    size = min(sizes, key=lambda size: abs(sizes[size] - diameter))
+    for designation in threadDataQuery.allDesignations(threadType, size):
+        designationPitch = threadDesignationPitch(designation)
+        if designationPitch is not None and abs(designationPitch - pitch) < 1e-6:
+            classes = threadDataQuery.allClasses(False, threadType, designation)
+            threadClass = recommendData[2] if recommendData[2] in classes else classes[0]
+            return designation, threadClass
+
+    return None
+
+
+def threadSizeDiameter(threadType, size):
+    # Returns the diameter in cm of a size of the thread data, "10" mm or "#10" and "1 1/4" in, or None if it isn't one.
+    try:
+        if threadType == INCH_THREAD_TYPE:
+            return thread_table.unified_size_inches(size) * thread_table.INCH
+        return float(size) * thread_table.MM
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def threadDesignationPitch(designation):
+    # Returns the pitch in cm of a designation like "M10x1.25" or "1/4-28 UNF", or None if it names none.
+    match = re.search(r'x\s*([\d.]+)$', designation)
+    if match:
+        return float(match.group(1)) * thread_table.MM
+    match = re.search(r'-\s*(\d+)\s*UN', designation)
+    if match:
+        return thread_table.INCH / int(match.group(1))
+    return None
+
+
+def readSpec(component: adsk.fusion.Component):
+    # Returns the spec stored on a printable bolt component or None if it wasn't built by this add-in.
+    specAttribute = component.attributes.itemByName(SPEC_ATTRIBUTE_GROUP, SPEC_ATTRIBUTE_NAME)
+    if specAttribute is None:
+        return None
+    return json.loads(specAttribute.value)
+
 
 class PrintableBolt:
     def __init__(self, ui, app):
@@ -7,11 +149,18 @@ class PrintableBolt:
         defaultBodyDiameter    = 0.5
         defaultHeadHeight      = 0.3125
         defaultHeadSides       = 6
+        defaultHeadProfile     = head_profiles.DEFAULT_HEAD_PROFILE
         defaultBodyLength      = 2.0
         defaultCutAngle        = 30.0 * (math.pi / 180)
         defaultChamferDistance = 0.03845
         defaultFilletRadius    = 0.02994
         defaultBacklash        = 0.0
+        defaultUseParameters   = False
+        defaultBuildMode       = BUILD_MODE_PARAMETRIC
+        defaultPitch           = None
+        defaultThreadStarts    = 1
+        defaultThreadAngle     = 60.0
+        defaultThreadStandard  = 'Metric'
 
         self.ui               = ui
         self.app              = app
@@ -20,11 +169,20 @@ class PrintableBolt:
         self._bodyDiameter    = defaultBodyDiameter
         self._headHeight      = defaultHeadHeight
         self._headSides       = defaultHeadSides
+        self._headProfile     = defaultHeadProfile
         self._bodyLength      = adsk.core.ValueInput.createByReal(defaultBodyLength)
         self._cutAngle        = defaultCutAngle
         self._chamferDistance = adsk.core.ValueInput.createByReal(defaultChamferDistance)
         self._filletRadius    = adsk.core.ValueInput.createByReal(defaultFilletRadius)
         self._backlash        = adsk.core.ValueInput.createByReal(defaultBacklash)
+        self._useParameters   = defaultUseParameters
+        self._buildMode       = defaultBuildMode
+        self._pitch           = defaultPitch
+        self._threadStarts    = defaultThreadStarts
+        self._threadAngle     = defaultThreadAngle
+        self._threadStandard  = defaultThreadStandard
+        self._threadRidges    = None
+        self._transform       = None
 
     #properties
     @property
@@ -62,6 +220,13 @@ class PrintableBolt:
     def headSides(self, value):
         self._headSides = value 
 
+    @property
+    def headProfile(self):
+        return self._headProfile
+    @headProfile.setter
+    def headProfile(self, value):
+        self._headProfile = value
+
     @property
     def bodyLength(self):
         return self._bodyLength
@@ -97,163 +262,693 @@ class PrintableBolt:
     def backlash(self, value):
         self._backlash = value
 
+    @property
+    def useParameters(self):
+        return self._useParameters
+    @useParameters.setter
+    def useParameters(self, value):
+        self._useParameters = value
+
+    @property
+    def buildMode(self):
+        return self._buildMode
+    @buildMode.setter
+    def buildMode(self, value):
+        self._buildMode = value
+
+    # The thread pitch in cm, None uses the pitch recommended for the shaft diameter.
+    @property
+    def pitch(self):
+        return self._pitch
+    @pitch.setter
+    def pitch(self, value):
+        self._pitch = value
+
+    @property
+    def threadStarts(self):
+        return self._threadStarts
+    @threadStarts.setter
+    def threadStarts(self, value):
+        self._threadStarts = value
+
+    # The included angle between the thread flanks in degrees.
+    @property
+    def threadAngle(self):
+        return self._threadAngle
+    @threadAngle.setter
+    def threadAngle(self, value):
+        self._threadAngle = value
+
+    # 'Metric' for ISO threads or 'English' for unified inch threads, which pick the standard pitch.
+    @property
+    def threadStandard(self):
+        return self._threadStandard
+    @threadStandard.setter
+    def threadStandard(self, value):
+        self._threadStandard = value
+
+    # The thread mesh computed ahead of the build, None computes it when the bolt needs one.
+    @property
+    def threadRidges(self):
+        return self._threadRidges
+    @threadRidges.setter
+    def threadRidges(self, value):
+        self._threadRidges = value
+
+    # Where the new component is placed, None places it at the origin.
+    @property
+    def transform(self):
+        return self._transform
+    @transform.setter
+    def transform(self, value):
+        self._transform = value
+
+    @property
+    def spec(self):
+        return {
+            'boltName':        self.boltName,
+            'headDiameter':    realValue(self.headDiameter),
+            'headHeight':      realValue(self.headHeight),
+            'headSides':       self.headSides,
+            'headProfile':     self.headProfile,
+            'bodyDiameter':    realValue(self.bodyDiameter),
+            'bodyLength':      realValue(self.bodyLength),
+            'chamferDistance': realValue(self.chamferDistance),
+            'filletRadius':    realValue(self.filletRadius),
+            'backlash':        realValue(self.backlash),
+            'buildMode':       self.buildMode,
+            'pitch':           self.pitch,
+            'threadStarts':    self.threadStarts,
+            'threadAngle':     self.threadAngle,
+            'threadStandard':  self.threadStandard,
+        }
+
+    def applySpec(self, spec):
+        # Sets the bolt up from a spec like the one stored on its component, missing fields keep their defaults.
+        for name in ['boltName', 'headDiameter', 'headHeight', 'headSides', 'headProfile', 'bodyDiameter',
+                     'buildMode', 'pitch', 'threadStarts', 'threadAngle', 'threadStandard']:
+            if name in spec:
+                setattr(self, name, spec[name])
+        for name in ['bodyLength', 'chamferDistance', 'filletRadius', 'backlash']:
+            if name in spec:
+                setattr(self, name, adsk.core.ValueInput.createByReal(spec[name]))
+
     def createNewComponent(self):
         # Get the active design.
         product = self.app.activeProduct
         design = adsk.fusion.Design.cast(product)
         rootComp = design.rootComponent
         allOccs = rootComp.occurrences
-        newOcc = allOccs.addNewComponent(adsk.core.Matrix3D.create())
+        newOcc = allOccs.addNewComponent(self.transform or adsk.core.Matrix3D.create())
         return newOcc.component
 
-    def buildBolt(self):
+    def buildBolt(self, event='execute'):
+        # Builds the bolt and appends how long each stage took to the build journal, event tells
+        # whether the build is a preview or the executed command.
+        record = journal.BuildRecord(event, spec_hash(self.spec), self.spec)
+        error = None
         try:
+            design = adsk.fusion.Design.cast(self.app.activeProduct)
+            timelineCount = self.timelineCount(design)
+
             global newComp
-            newComp = self.createNewComponent()
+            with record.stage('component'):
+                newComp = self.createNewComponent()
             if newComp is None:
+                error = RuntimeError('New component failed to create')
                 self.ui.messageBox('New component failed to create', 'New Component Failed')
                 return
 
-            # Create a new sketch.
-            sketches = newComp.sketches
-            xyPlane = newComp.xYConstructionPlane
-            xzPlane = newComp.xZConstructionPlane
-            sketch = sketches.add(xyPlane)
-            center = adsk.core.Point3D.create(0, 0, 0)
-
-            # Extrude a polygonal head
-            if self.headSides > 0:
-                vertices = []
-
-                for i in range(0, self.headSides):
-                    vertex = adsk.core.Point3D.create(
-                        center.x + (self.headDiameter / 2) * math.cos(math.pi * i / (self.headSides / 2)),
-                        center.y + (self.headDiameter / 2) * math.sin(math.pi * i / (self.headSides / 2)),
-                        0
-                    )
-                    vertices.append(vertex)
-
-                for i in range(0, self.headSides):
-                    sketch.sketchCurves.sketchLines.addByTwoPoints(vertices[(i+1) % self.headSides], vertices[i])
-
-                extrudes = newComp.features.extrudeFeatures
-                prof = sketch.profiles[0]
-                extInput = extrudes.createInput(prof, adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
-
-                distance = adsk.core.ValueInput.createByReal(self.headHeight)
-                extInput.setDistanceExtent(False, distance)
-                headExt = extrudes.add(extInput)
-
-            # Extrude a circular head to give the body a base
+            # Threads Fusion can't model, because of their pitch, starts or profile angle, are added as a mesh
+            # on a shaft turned down to the thread root.
+            with record.stage('threadData'):
+                threadData = self.resolveThreadData(newComp)
+                customThread = threadData is None and not self.isRecommendedThread()
+                shaftDiameter = self.customThreadRootDiameter() if customThread else self.bodyDiameter
+
+            with record.stage('body'):
+                if self.buildMode == BUILD_MODE_DIRECT:
+                    # Direct bodies have no dimensions that parameters could drive.
+                    parameters = {}
+                    sideFace = self.buildDirectBody(newComp, shaftDiameter)
+                else:
+                    # Bind the dimensions to user parameters so the bolt can be resized without regenerating it.
+                    parameters = self.createParameters(customThread) if self.useParameters else {}
+                    sideFace = self.buildParametricBody(newComp, parameters, shaftDiameter)
+
+            with record.stage('thread'):
+                if customThread:
+                    record.record['thread'] = self.buildMeshThread(newComp)
+                    record.record['triangles'] = record.record['thread']['triangles']
+                else:
+                    record.record['thread'] = self.buildThread(newComp, sideFace, parameters, threadData)
+
+            # Store what the bolt was built from so it can be edited later.
+            with record.stage('spec'):
+                spec = self.spec
+                spec['parameters'] = parameters
+                newComp.attributes.add(SPEC_ATTRIBUTE_GROUP, SPEC_ATTRIBUTE_NAME, json.dumps(spec))
+
+            record.record['features'] = self.timelineCount(design) - timelineCount
+            record.record['bodies'] = newComp.bRepBodies.count
+
+            return newComp
+
+        except Exception as e:
+            error = e
+            # A batch carries on with its other bolts, so its failures are logged instead of stopping it.
+            if event == 'batch':
+                futil.handle_error(f'Printable Bolt {self.boltName}')
             else:
-                sketch.sketchCurves.sketchCircles.addByCenterRadius(center, self.bodyDiameter / 100)
-
-                extrudes = newComp.features.extrudeFeatures
-                prof = sketch.profiles[0]
-                extInput = extrudes.createInput(prof, adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
-
-                distance = adsk.core.ValueInput.createByReal(self.headHeight)
-                extInput.setDistanceExtent(False, distance)
-                headExt = extrudes.add(extInput)
-
-            fc = headExt.faces[1]
-            bd = fc.body
-            bd.name = self.boltName
-
-            #create the body
-            bodySketch = sketches.add(xyPlane)
-            bodySketch.sketchCurves.sketchCircles.addByCenterRadius(center, self.bodyDiameter / 2)
-
-            bodyProf = bodySketch.profiles[0]
-            bodyExtInput = extrudes.createInput(bodyProf, adsk.fusion.FeatureOperations.JoinFeatureOperation)
-
-            bodyExtInput.setAllExtent(adsk.fusion.ExtentDirections.NegativeExtentDirection)
-            bodyExtInput.setDistanceExtent(False, self.bodyLength)
-            bodyExt = extrudes.add(bodyExtInput)
-
-            # create chamfer on head
-            if False:
-                edgeCol = adsk.core.ObjectCollection.create()
-                edges = bodyExt.endFaces[0].edges
-                for edgeI  in edges:
-                    edgeCol.add(edgeI)
-
-                chamferFeats = newComp.features.chamferFeatures
-                chamferInput = chamferFeats.createInput(edgeCol, True)
-                chamferInput.setToEqualDistance(self.chamferDistance)
-                chamferFeats.add(chamferInput)
-
-                # create fillet
-                edgeCol.clear()
-                loops = headExt.endFaces[0].loops
-                edgeLoop = None
-                for edgeLoop in loops:
-                    #since there two edgeloops in the start face of head, one consists of one circle edge while the other six edges
-                    if(len(edgeLoop.edges) == 1):
-                        break
-
-                edgeCol.add(edgeLoop.edges[0])  
-                filletFeats = newComp.features.filletFeatures
-                filletInput = filletFeats.createInput()
-                filletInput.addConstantRadiusEdgeSet(edgeCol, self.filletRadius, True)
-                filletFeats.add(filletInput)
-
-                #create revolve feature 1
-                revolveSketchOne = sketches.add(xzPlane)
-                radius = self.headDiameter/2
-                point1 = revolveSketchOne.modelToSketchSpace(adsk.core.Point3D.create(center.x + radius*math.cos(math.pi/6), 0, center.y))
-                point2 = revolveSketchOne.modelToSketchSpace(adsk.core.Point3D.create(center.x + radius, 0, center.y))
-
-                point3 = revolveSketchOne.modelToSketchSpace(adsk.core.Point3D.create(point2.x, 0, (point2.x - point1.x) * math.tan(self.cutAngle)))
-                revolveSketchOne.sketchCurves.sketchLines.addByTwoPoints(point1, point2)
-                revolveSketchOne.sketchCurves.sketchLines.addByTwoPoints(point2, point3)
-                revolveSketchOne.sketchCurves.sketchLines.addByTwoPoints(point3, point1)
-
-                #revolve feature 2
-                revolveSketchTwo = sketches.add(xzPlane)
-                point4 = revolveSketchTwo.modelToSketchSpace(adsk.core.Point3D.create(center.x + radius*math.cos(math.pi/6), 0, self.headHeight - center.y))
-                point5 = revolveSketchTwo.modelToSketchSpace(adsk.core.Point3D.create(center.x + radius, 0, self.headHeight - center.y))
-                point6 = revolveSketchTwo.modelToSketchSpace(adsk.core.Point3D.create(center.x + point2.x, 0, self.headHeight - center.y - (point5.x - point4.x) * math.tan(self.cutAngle)))
-                revolveSketchTwo.sketchCurves.sketchLines.addByTwoPoints(point4, point5)
-                revolveSketchTwo.sketchCurves.sketchLines.addByTwoPoints(point5, point6)
-                revolveSketchTwo.sketchCurves.sketchLines.addByTwoPoints(point6, point4)
-
-                zaxis = newComp.zConstructionAxis
-                revolves = newComp.features.revolveFeatures
-                revProf1 = revolveSketchTwo.profiles[0]
-                revInput1 = revolves.createInput(revProf1, zaxis, adsk.fusion.FeatureOperations.CutFeatureOperation)
-
-                revAngle = adsk.core.ValueInput.createByReal(math.pi*2)
-                revInput1.setAngleExtent(False,revAngle)
-                revolves.add(revInput1)
-
-                revProf2 = revolveSketchOne.profiles[0]
-                revInput2 = revolves.createInput(revProf2, zaxis, adsk.fusion.FeatureOperations.CutFeatureOperation)
-
-                revInput2.setAngleExtent(False,revAngle)
-                revolves.add(revInput2)
-            
-            sideFace = bodyExt.sideFaces[0]
-            threads = newComp.features.threadFeatures
-            threadDataQuery = threads.threadDataQuery
-            defaultThreadType = threadDataQuery.defaultMetricThreadType
-            recommendData = threadDataQuery.recommendThreadData(self.bodyDiameter, False, defaultThreadType)
-            if recommendData[0]:
-                threadInfo = threads.createThreadInfo(False, defaultThreadType, recommendData[1], recommendData[2])
-                faces = adsk.core.ObjectCollection.create()
-                faces.add(sideFace)
-                threadInput = threads.createInput(faces, threadInfo)
-                threadInput.isModeled = True
-                threads.add(threadInput)
-                threadFaces = threads[0].faces
-                offsetFaces = adsk.core.ObjectCollection.create()
-
-                for face in threadFaces:
-                    offsetFaces.add(face)
-                offsetFeatures = newComp.features.offsetFeatures
-                offsetFaceFeatureInput = offsetFeatures.createInput(offsetFaces, adsk.core.ValueInput.createByReal(-0.1), adsk.fusion.FeatureOperations.NewBodyFeatureOperation, False)
-
-                offsetFeatures.add(offsetFaceFeatureInput)
+                self.ui.messageBox(traceback.format_exc())
+
+        finally:
+            self.writeJournal(record.finish(error))
+
+    def timelineCount(self, design):
+        # Direct modeling designs have no timeline to count the features in.
+        if design.designType != adsk.fusion.DesignTypes.ParametricDesignType:
+            return 0
+        return design.timeline.count
+
+    def writeJournal(self, record):
+        if _threadStageTimes is not None and record['outcome'] == 'success' and 'thread' in record['stages']:
+            _threadStageTimes[record['specHash']] = record['stages']['thread']
+        if not config.JOURNAL_ENABLED:
+            return
 
+        # A journal that can't be written must never fail the build itself.
+        try:
+            journal.append(config.JOURNAL_PATH, record, config.JOURNAL_MAX_BYTES, config.JOURNAL_BACKUPS)
         except:
-            self.ui.messageBox(traceback.format_exc())
\ No newline at end of file
+            futil.handle_error('Printable Bolt journal')
+
+    def buildParametricBody(self, newComp, parameters, shaftDiameter):
+        # Builds the head and shaft from sketches and extrudes and returns the face of the shaft to thread.
+        # Create a new sketch.
+        sketches = newComp.sketches
+        xyPlane = newComp.xYConstructionPlane
+        xzPlane = newComp.xZConstructionPlane
+        sketch = sketches.add(xyPlane)
+        center = adsk.core.Point3D.create(0, 0, 0)
+
+        # Extrude the head from the outline of its profile
+        if self.headSides > 0:
+            profile = head_profiles.HEAD_PROFILES[self.headProfile]
+            headRadius = self.headDiameter / 2
+            headDiameterExpression = parameters.get('headDiameter')
+
+            if profile.round and profile.is_regular:
+                outline = sketch.sketchCurves.sketchCircles.addByCenterRadius(sketch.originPoint, headRadius)
+                if headDiameterExpression:
+                    self.dimensionDiameter(sketch, outline, headDiameterExpression)
+            # The sampled outline tables are only meant for meshes, notched rims are drawn as true arcs.
+            elif profile.round:
+                self.drawNotchedCircle(sketch, profile, headRadius)
+            else:
+                self.drawPolygon(sketch, head_profiles.unit_outline(self.headProfile, self.headSides), headRadius, headDiameterExpression)
+
+            if profile.socket_sides:
+                socketExpression = headDiameterExpression and f'{headDiameterExpression} * {profile.socket_ratio}'
+                self.drawPolygon(sketch, head_profiles.unit_circle(profile.socket_sides), headRadius * profile.socket_ratio, socketExpression)
+
+            if profile.flange_ratio:
+                flange = sketch.sketchCurves.sketchCircles.addByCenterRadius(sketch.originPoint, headRadius * profile.flange_ratio)
+                if headDiameterExpression:
+                    self.dimensionDiameter(sketch, flange, f'{headDiameterExpression} * {profile.flange_ratio}')
+
+            # A socket leaves the head as the profile with a hole in it, a flange surrounds the head profile.
+            extrudes = newComp.features.extrudeFeatures
+            prof = self.profileWithLoops(sketch, 2 if profile.socket_sides else 1)
+            extInput = extrudes.createInput(prof, adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
+
+            distance = self.valueInput(parameters, 'headHeight')
+            extInput.setDistanceExtent(False, distance)
+            headExt = extrudes.add(extInput)
+
+            if profile.flange_ratio:
+                flangeInput = extrudes.createInput(self.profileWithLoops(sketch, 2), adsk.fusion.FeatureOperations.JoinFeatureOperation)
+                if 'headHeight' in parameters:
+                    flangeHeight = adsk.core.ValueInput.createByString(f'{parameters["headHeight"]} * {profile.flange_height_ratio}')
+                else:
+                    flangeHeight = adsk.core.ValueInput.createByReal(self.headHeight * profile.flange_height_ratio)
+                flangeInput.setDistanceExtent(False, flangeHeight)
+                extrudes.add(flangeInput)
+
+        # Extrude a circular head to give the body a base
+        else:
+            baseCircle = sketch.sketchCurves.sketchCircles.addByCenterRadius(sketch.originPoint, self.bodyDiameter / 100)
+
+            if 'bodyDiameter' in parameters:
+                self.dimensionDiameter(sketch, baseCircle, f'{parameters["bodyDiameter"]} / 50')
+
+            extrudes = newComp.features.extrudeFeatures
+            prof = sketch.profiles[0]
+            extInput = extrudes.createInput(prof, adsk.fusion.FeatureOperations.NewBodyFeatureOperation)
+
+            distance = self.valueInput(parameters, 'headHeight')
+            extInput.setDistanceExtent(False, distance)
+            headExt = extrudes.add(extInput)
+
+        fc = headExt.faces[1]
+        bd = fc.body
+        bd.name = self.boltName
+
+        #create the body
+        bodySketch = sketches.add(xyPlane)
+        bodyCircle = bodySketch.sketchCurves.sketchCircles.addByCenterRadius(bodySketch.originPoint, shaftDiameter / 2)
+
+        if 'bodyDiameter' in parameters:
+            self.dimensionDiameter(bodySketch, bodyCircle, parameters['bodyDiameter'])
+
+        bodyProf = bodySketch.profiles[0]
+        bodyExtInput = extrudes.createInput(bodyProf, adsk.fusion.FeatureOperations.JoinFeatureOperation)
+
+        bodyExtInput.setAllExtent(adsk.fusion.ExtentDirections.NegativeExtentDirection)
+        bodyExtInput.setDistanceExtent(False, self.valueInput(parameters, 'bodyLength'))
+        bodyExt = extrudes.add(bodyExtInput)
+
+        # create chamfer on head
+        if False:
+            edgeCol = adsk.core.ObjectCollection.create()
+            edges = bodyExt.endFaces[0].edges
+            for edgeI  in edges:
+                edgeCol.add(edgeI)
+
+            chamferFeats = newComp.features.chamferFeatures
+            chamferInput = chamferFeats.createInput(edgeCol, True)
+            chamferInput.setToEqualDistance(self.chamferDistance)
+            chamferFeats.add(chamferInput)
+
+            # create fillet
+            edgeCol.clear()
+            loops = headExt.endFaces[0].loops
+            edgeLoop = None
+            for edgeLoop in loops:
+                #since there two edgeloops in the start face of head, one consists of one circle edge while the other six edges
+                if(len(edgeLoop.edges) == 1):
+                    break
+
+            edgeCol.add(edgeLoop.edges[0])  
+            filletFeats = newComp.features.filletFeatures
+            filletInput = filletFeats.createInput()
+            filletInput.addConstantRadiusEdgeSet(edgeCol, self.filletRadius, True)
+            filletFeats.add(filletInput)
+
+            #create revolve feature 1
+            revolveSketchOne = sketches.add(xzPlane)
+            radius = self.headDiameter/2
+            point1 = revolveSketchOne.modelToSketchSpace(adsk.core.Point3D.create(center.x + radius*math.cos(math.pi/6), 0, center.y))
+            point2 = revolveSketchOne.modelToSketchSpace(adsk.core.Point3D.create(center.x + radius, 0, center.y))
+
+            point3 = revolveSketchOne.modelToSketchSpace(adsk.core.Point3D.create(point2.x, 0, (point2.x - point1.x) * math.tan(self.cutAngle)))
+            revolveSketchOne.sketchCurves.sketchLines.addByTwoPoints(point1, point2)
+            revolveSketchOne.sketchCurves.sketchLines.addByTwoPoints(point2, point3)
+            revolveSketchOne.sketchCurves.sketchLines.addByTwoPoints(point3, point1)
+
+            #revolve feature 2
+            revolveSketchTwo = sketches.add(xzPlane)
+            point4 = revolveSketchTwo.modelToSketchSpace(adsk.core.Point3D.create(center.x + radius*math.cos(math.pi/6), 0, self.headHeight - center.y))
+            point5 = revolveSketchTwo.modelToSketchSpace(adsk.core.Point3D.create(center.x + radius, 0, self.headHeight - center.y))
+            point6 = revolveSketchTwo.modelToSketchSpace(adsk.core.Point3D.create(center.x + point2.x, 0, self.headHeight - center.y - (point5.x - point4.x) * math.tan(self.cutAngle)))
+            revolveSketchTwo.sketchCurves.sketchLines.addByTwoPoints(point4, point5)
+            revolveSketchTwo.sketchCurves.sketchLines.addByTwoPoints(point5, point6)
+            revolveSketchTwo.sketchCurves.sketchLines.addByTwoPoints(point6, point4)
+
+            zaxis = newComp.zConstructionAxis
+            revolves = newComp.features.revolveFeatures
+            revProf1 = revolveSketchTwo.profiles[0]
+            revInput1 = revolves.createInput(revProf1, zaxis, adsk.fusion.FeatureOperations.CutFeatureOperation)
+
+            revAngle = adsk.core.ValueInput.createByReal(math.pi*2)
+            revInput1.setAngleExtent(False,revAngle)
+            revolves.add(revInput1)
+
+            revProf2 = revolveSketchOne.profiles[0]
+            revInput2 = revolves.createInput(revProf2, zaxis, adsk.fusion.FeatureOperations.CutFeatureOperation)
+
+            revInput2.setAngleExtent(False,revAngle)
+            revolves.add(revInput2)
+
+        return bodyExt.sideFaces[0]
+
+    def buildDirectBody(self, newComp, shaftDiameter):
+        # Builds the head and shaft as one temporary B-rep body and inserts it with a single base feature,
+        # or without any feature in a direct design. Returns the face of the shaft to thread.
+        tempBRep = adsk.fusion.TemporaryBRepManager.get()
+        origin = adsk.core.Point3D.create(0, 0, 0)
+
+        if self.headSides > 0:
+            body = self.createTemporaryHead(tempBRep)
+        # A circular head to give the body a base, matching the parametric build.
+        else:
+            body = tempBRep.createCylinderOrCone(origin, self.bodyDiameter / 100, adsk.core.Point3D.create(0, 0, self.headHeight), self.bodyDiameter / 100)
+
+        shaftRadius = shaftDiameter / 2
+        shaftEnd = adsk.core.Point3D.create(0, 0, -realValue(self.bodyLength))
+        shaft = tempBRep.createCylinderOrCone(origin, shaftRadius, shaftEnd, shaftRadius)
+        tempBRep.booleanOperation(body, shaft, adsk.fusion.BooleanTypes.UnionBooleanType)
+
+        design = adsk.fusion.Design.cast(self.app.activeProduct)
+        if design.designType == adsk.fusion.DesignTypes.DirectDesignType:
+            bolt = newComp.bRepBodies.add(body)
+        else:
+            baseFeature = newComp.features.baseFeatures.add()
+            baseFeature.startEdit()
+            bolt = newComp.bRepBodies.add(body, baseFeature)
+            baseFeature.finishEdit()
+            bolt = baseFeature.bodies[0]
+
+        bolt.name = self.boltName
+
+        # The shaft is the only cylinder with the shaft radius that extends below the head.
+        for face in bolt.faces:
+            geometry = face.geometry
+            if isinstance(geometry, adsk.core.Cylinder) and abs(geometry.radius - shaftRadius) < 1e-6 and face.boundingBox.minPoint.z < 0:
+                return face
+
+    def createTemporaryHead(self, tempBRep):
+        # Creates the head of the selected profile from cylinders, boxes and booleans.
+        profile = head_profiles.HEAD_PROFILES[self.headProfile]
+        radius = self.headDiameter / 2
+
+        if profile.round:
+            head = self.createTemporaryCylinder(tempBRep, adsk.core.Point3D.create(0, 0, 0), radius, 0, self.headHeight)
+        else:
+            head = self.createTemporaryPrism(tempBRep, profile.sides or self.headSides, radius, 0, self.headHeight)
+
+        # Cut the notches as cylinders centered on the rim.
+        notchCenters = head_profiles.unit_circle(profile.notches) if profile.notches else []
+        for cos, sin in notchCenters:
+            notchCenter = adsk.core.Point3D.create(radius * cos, radius * sin, 0)
+            notch = self.createTemporaryCylinder(tempBRep, notchCenter, radius * profile.notch_ratio, -self.headHeight, self.headHeight * 2)
+            tempBRep.booleanOperation(head, notch, adsk.fusion.BooleanTypes.DifferenceBooleanType)
+
+        if profile.socket_sides:
+            socket = self.createTemporaryPrism(tempBRep, profile.socket_sides, radius * profile.socket_ratio, 0, self.headHeight * 2)
+            tempBRep.booleanOperation(head, socket, adsk.fusion.BooleanTypes.DifferenceBooleanType)
+
+        if profile.flange_ratio:
+            flange = self.createTemporaryCylinder(tempBRep, adsk.core.Point3D.create(0, 0, 0), radius * profile.flange_ratio, 0, self.headHeight * profile.flange_height_ratio)
+            tempBRep.booleanOperation(head, flange, adsk.fusion.BooleanTypes.UnionBooleanType)
+
+        return head
+
+    def createTemporaryCylinder(self, tempBRep, center, radius, bottom, top):
+        return tempBRep.createCylinderOrCone(
+            adsk.core.Point3D.create(center.x, center.y, bottom), radius,
+            adsk.core.Point3D.create(center.x, center.y, top), radius
+        )
+
+    def createTemporaryPrism(self, tempBRep, sides, radius, bottom, top):
+        # Creates a regular polygonal prism by cutting the flats off a cylinder of the corner radius.
+        prism = self.createTemporaryCylinder(tempBRep, adsk.core.Point3D.create(0, 0, 0), radius, bottom, top)
+        apothem = radius * math.cos(math.pi / sides)
+        height = top - bottom
+
+        for i in range(0, sides):
+            # The flat between vertex i and i + 1 faces the angle halfway between them.
+            angle = math.pi * (2 * i + 1) / sides
+            normal = adsk.core.Vector3D.create(math.cos(angle), math.sin(angle), 0)
+            tangent = adsk.core.Vector3D.create(-math.sin(angle), math.cos(angle), 0)
+            boxCenter = adsk.core.Point3D.create(normal.x * (apothem + radius / 2), normal.y * (apothem + radius / 2), bottom + height / 2)
+            box = adsk.core.OrientedBoundingBox3D.create(boxCenter, normal, tangent, radius, radius * 2, height * 2)
+            tempBRep.booleanOperation(prism, tempBRep.createBox(box), adsk.fusion.BooleanTypes.DifferenceBooleanType)
+
+        return prism
+
+    def isRecommendedThread(self):
+        return is_recommended_thread(self.spec)
+
+    def threadPitch(self):
+        # The pitch override, or the coarse pitch of the nearest size of the standard for meshes that can't query Fusion.
+        return thread_pitch(self.spec)
+
+    def resolveThreadData(self, newComp):
+        # Returns the thread type, designation and class of the standard thread to model, or None if the
+        # thread isn't a single start 60 degree thread the standard has.
+        if self.threadStarts != 1 or abs(self.threadAngle - 60.0) > 1e-9:
+            return None
+
+        threadDataQuery = newComp.features.threadFeatures.threadDataQuery
+        threadType = threadTypeOf(threadDataQuery, self.threadStandard)
+        if threadType is None:
+            return None
+        threadData = queryThreadData(threadDataQuery, threadType, self.bodyDiameter, self.pitch)
+        if threadData is None:
+            return None
+        return {'type': threadType, 'designation': threadData[0], 'class': threadData[1]}
+
+    def customThreadRootDiameter(self):
+        root, _, _ = mesh.thread_profile(self.bodyDiameter, self.threadPitch(), realValue(self.backlash), self.threadAngle)
+        if root <= 0:
+            raise ValueError(f'A {self.threadPitch() * 10:g} mm pitch {self.threadAngle:g} degree thread is deeper than the shaft radius.')
+        return root * 2
+
+    def threadMesh(self):
+        # Batches compute the ridges ahead on a worker thread, see threadRidges.
+        if self.threadRidges is not None:
+            return self.threadRidges
+        return thread_mesh(self.spec)
+
+    def threadReport(self):
+        # Describes the thread and how long it takes to generate, counted and estimated rather than built so
+        # previews stay fast. A spec built before reports the journaled time of its thread stage instead.
+        pitch = self.threadPitch() * 10
+        starts = f'{self.threadStarts} starts' if self.threadStarts > 1 else '1 start'
+        description = f'{pitch:g} mm pitch, {starts}, {self.threadAngle:g}\u00b0'
+        builtTime = threadStageTimes().get(spec_hash(self.spec))
+        built = f', last built in {builtTime * 1000:.0f} ms' if builtTime is not None else ''
+        if self.isRecommendedThread():
+            return f'{description}: modeled by Fusion{built}'
+
+        triangles = thread_triangle_count(self.spec)
+        generation = built or f', about {triangles * secondsPerThreadTriangle() * 1000:.0f} ms to generate'
+        if self.threadStarts == 1 and abs(self.threadAngle - 60.0) < 1e-9:
+            return f'{description}: modeled by Fusion if its thread table has the pitch, otherwise {triangles:,} mesh triangles{generation}'
+        return f'{description}: {triangles:,} mesh triangles{generation}'
+
+    def buildMeshThread(self, newComp):
+        # Adds the thread ridges as a mesh body around the shaft.
+        ridges = self.threadMesh()
+        threadBody = newComp.meshBodies.addByTriangleMeshData(ridges.coordinates, ridges.indices, [], [])
+        threadBody.name = f'{self.boltName} Thread'
+
+        return {
+            'type': 'mesh',
+            'pitch': self.threadPitch(),
+            'starts': self.threadStarts,
+            'angle': self.threadAngle,
+            'triangles': ridges.triangle_count,
+        }
+
+    def buildThread(self, newComp, sideFace, parameters, threadData):
+        # Models the thread on the shaft and offsets its faces by the backlash.
+        if threadData is None:
+            return None
+
+        threads = newComp.features.threadFeatures
+        threadInfo = threads.createThreadInfo(False, threadData['type'], threadData['designation'], threadData['class'])
+        faces = adsk.core.ObjectCollection.create()
+        faces.add(sideFace)
+        threadInput = threads.createInput(faces, threadInfo)
+        threadInput.isModeled = True
+        threads.add(threadInput)
+        threadFaces = threads[0].faces
+        offsetFaces = adsk.core.ObjectCollection.create()
+
+        for face in threadFaces:
+            offsetFaces.add(face)
+        offsetFeatures = newComp.features.offsetFeatures
+        if 'backlash' in parameters:
+            offsetDistance = adsk.core.ValueInput.createByString(f'-{parameters["backlash"]}')
+        else:
+            offsetDistance = adsk.core.ValueInput.createByReal(-realValue(self.backlash))
+        offsetFaceFeatureInput = offsetFeatures.createInput(offsetFaces, offsetDistance, adsk.fusion.FeatureOperations.NewBodyFeatureOperation, False)
+
+        offsetFeatures.add(offsetFaceFeatureInput)
+
+        return dict(threadData, starts=1, angle=60.0)
+
+    def previewMesh(self):
+        # Computes the bolt mesh in Python, the recommended pitch comes from the ISO table since the
+        # thread data query belongs to a component that previews no longer create.
+        boltMesh = mesh.bolt(
+            self.headDiameter, self.headHeight, self.headSides,
+            self.bodyDiameter, realValue(self.bodyLength),
+            self.threadPitch(), realValue(self.backlash),
+            head_profile=self.headProfile,
+            thread_starts=self.threadStarts, thread_angle=self.threadAngle
+        )
+        return boltMesh
+
+    def buildPreviewGraphics(self):
+        # Draws the bolt as custom graphics without creating any component, sketch or feature, so the
+        # cost of a preview does not depend on the design it is previewed in.
+        record = journal.BuildRecord('preview', spec_hash(self.spec), self.spec)
+        error = None
+        try:
+            with record.stage('mesh'):
+                boltMesh = self.previewMesh()
+                combined = boltMesh.combined()
+
+            with record.stage('graphics'):
+                design = adsk.fusion.Design.cast(self.app.activeProduct)
+                graphics = design.rootComponent.customGraphicsGroups.add()
+                coordinates = adsk.fusion.CustomGraphicsCoordinates.create(combined.coordinates)
+
+                # Empty normals let Fusion calculate them from the triangles.
+                graphics.addMesh(coordinates, combined.indices, [], [])
+
+            record.record['thread'] = {'type': 'preview', 'pitch': self.threadPitch(), 'starts': self.threadStarts, 'angle': self.threadAngle}
+            record.record['triangles'] = combined.triangle_count
+
+            return graphics
+
+        except Exception as e:
+            error = e
+            self.ui.messageBox(traceback.format_exc())
+
+        finally:
+            self.writeJournal(record.finish(error))
+
+    def valueInput(self, parameters, name):
+        # Returns a value input referencing the user parameter for the dimension if there is one.
+        if name in parameters:
+            return adsk.core.ValueInput.createByString(parameters[name])
+        return adsk.core.ValueInput.createByReal(realValue(getattr(self, name)))
+
+    def createParameters(self, customThread=False):
+        # Creates one user parameter per bindable dimension, prefixed with the first free "PrintableBoltN".
+        # A mesh thread can't follow the shaft diameter, length or backlash, so they aren't bound then.
+        design = adsk.fusion.Design.cast(self.app.activeProduct)
+        userParameters = design.userParameters
+        units = design.unitsManager.defaultLengthUnits
+
+        # Any dimension may be left unbound, so an index is only free when none of its parameters exist.
+        index = 1
+        while any(userParameters.itemByName(f'PrintableBolt{index}_{name}') is not None for name in PARAMETER_NAMES):
+            index += 1
+
+        parameters = {}
+        for name in PARAMETER_NAMES:
+            # A headless bolt has no head diameter to drive and a notched head can't be dimensioned by it.
+            if name == 'headDiameter' and (self.headSides <= 0 or not head_profiles.HEAD_PROFILES[self.headProfile].is_regular):
+                continue
+            if name in THREAD_PARAMETER_NAMES and customThread:
+                continue
+
+            parameterName = f'PrintableBolt{index}_{name}'
+            value = adsk.core.ValueInput.createByReal(realValue(getattr(self, name)))
+            userParameters.add(parameterName, value, units, f'{self.boltName} {name}')
+            parameters[name] = parameterName
+
+        return parameters
+
+    def dimensionDiameter(self, sketch, circle, expression):
+        radius = circle.radius
+        textPoint = adsk.core.Point3D.create(radius, radius, 0)
+        dimension = sketch.sketchDimensions.addDiameterDimension(circle, textPoint)
+        dimension.parameter.expression = expression
+
+    def drawPolygon(self, sketch, unitPoints, radius, diameterExpression=None):
+        # Draws a closed polygon from a unit outline, constrained to a regular polygon when its diameter is driven.
+        vertices = [sketch.sketchPoints.add(adsk.core.Point3D.create(x * radius, y * radius, 0)) for x, y in unitPoints]
+
+        # The lines share their sketch points so the polygon can be constrained as a whole.
+        lines = []
+        for i in range(0, len(vertices)):
+            lines.append(sketch.sketchCurves.sketchLines.addByTwoPoints(vertices[(i+1) % len(vertices)], vertices[i]))
+
+        if diameterExpression:
+            self.constrainPolygon(sketch, vertices, lines, radius, diameterExpression)
+
+    def drawNotchedCircle(self, sketch, profile, radius):
+        # Draws a circle with circular notches centered on its rim as one closed loop of arcs, the same
+        # outline the direct build cuts with cylinders.
+        notchRadius = radius * profile.notch_ratio
+        # The angle from the center of a notch to where it meets the rim, the chord to there is the notch radius.
+        halfGap = 2 * math.asin(profile.notch_ratio / 2)
+        step = 2 * math.pi / profile.notches
+
+        def pointAt(angle, distance):
+            return adsk.core.Point3D.create(distance * math.cos(angle), distance * math.sin(angle), 0)
+
+        # The points where each notch meets the rim, before and after its center.
+        corners = [(sketch.sketchPoints.add(pointAt(i * step - halfGap, radius)),
+                    sketch.sketchPoints.add(pointAt(i * step + halfGap, radius))) for i in range(profile.notches)]
+
+        arcs = sketch.sketchCurves.sketchArcs
+        for i in range(profile.notches):
+            before, after = corners[i]
+            following = corners[(i + 1) % profile.notches][0]
+            arcs.addByThreePoints(before, pointAt(i * step, radius - notchRadius), after)
+            arcs.addByThreePoints(after, pointAt((i + 0.5) * step, radius), following)
+
+    def profileWithLoops(self, sketch, loopCount):
+        for profile in sketch.profiles:
+            if profile.profileLoops.count == loopCount:
+                return profile
+
+    def constrainPolygon(self, sketch, vertices, lines, radius, diameterExpression):
+        # Keep the polygon regular and inscribed in a construction circle driven by the diameter expression.
+        constraints = sketch.geometricConstraints
+        circle = sketch.sketchCurves.sketchCircles.addByCenterRadius(sketch.originPoint, radius)
+        circle.isConstruction = True
+
+        for vertex in vertices:
+            constraints.addCoincident(vertex, circle)
+
+        for line in lines[1:]:
+            constraints.addEqual(lines[0], line)
+
+        # Fix the rotation of the polygon with a horizontal spoke to its first vertex.
+        spoke = sketch.sketchCurves.sketchLines.addByTwoPoints(sketch.originPoint, vertices[0])
+        spoke.isConstruction = True
+        constraints.addHorizontal(spoke)
+
+        self.dimensionDiameter(sketch, circle, diameterExpression)
+
+    def updateBolt(self, component: adsk.fusion.Component):
+        # Applies the dimensions of this bolt to an existing parameter driven bolt, only touching the user
+        # parameters whose values changed so Fusion can recompute the bolt incrementally.
+        # Returns the names of the dimensions that were changed.
+        spec = readSpec(component)
+        if spec is None or not spec.get('parameters'):
+            raise ValueError('The component is not a parameter driven printable bolt.')
+
+        design = adsk.fusion.Design.cast(self.app.activeProduct)
+        changed = []
+        for name, parameterName in spec['parameters'].items():
+            parameter = design.userParameters.itemByName(parameterName)
+            if parameter is None:
+                continue
+
+            value = realValue(getattr(self, name))
+            if abs(parameter.value - value) > 1e-9:
+                parameter.value = value
+                changed.append(name)
+            spec[name] = value
+
+        # The thread size is picked from the shaft diameter so it has to follow it. A pitch override the new
+        # size has no thread for falls back to the recommended thread, which is reported as a changed pitch.
+        if 'bodyDiameter' in changed:
+            threads = component.features.threadFeatures
+            if threads.count > 0:
+                threadDataQuery = threads.threadDataQuery
+                threadType = threadTypeOf(threadDataQuery, spec.get('threadStandard', 'Metric'))
+                if threadType is None:
+                    raise ValueError('Fusion has no thread data for the thread standard of the bolt.')
+
+                threadData = queryThreadData(threadDataQuery, threadType, spec['bodyDiameter'], spec.get('pitch'))
+                if threadData is None and spec.get('pitch') is not None:
+                    threadData = queryThreadData(threadDataQuery, threadType, spec['bodyDiameter'])
+                    spec['pitch'] = None
+                    changed.append('pitch')
+                if threadData is None:
+                    raise ValueError(f'There is no standard thread for a {spec["bodyDiameter"] * 10:g} mm shaft.')
+                threads[0].threadInfo = threads.createThreadInfo(False, threadType, threadData[0], threadData[1])
+
+        component.attributes.add(SPEC_ATTRIBUTE_GROUP, SPEC_ATTRIBUTE_NAME, json.dumps(spec))
+
+        return changed
\ No newline at end of file
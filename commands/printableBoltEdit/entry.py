@@ -0,0 +1,170 @@
+import adsk.core
+import os
+from ...lib import fusion360utils as futil
+from ... import config
+
+# The application and the command logic are only fetched once they are needed, see start()
+# and command_created(), so loading the add-in stays cheap while Fusion is starting.
+app: adsk.core.Application = None
+ui: adsk.core.UserInterface = None
+
+printable_bolt_edit_logic: 'logic.PrintableBoltEditLogic' = None
+
+# Specify the command identity information.
+CMD_ID = f'{config.COMPANY_NAME}_{config.ADDIN_NAME}_printableBoltEdit'
+CMD_NAME = 'Edit Printable Bolt'
+CMD_Description = ('Resize a printable bolt that was built with user parameters. '
+                   'Only the parameters that changed are updated so Fusion recomputes '
+                   'the bolt instead of it being regenerated.')
+
+# Specify that the command will be promoted to the panel.
+IS_PROMOTED = False
+
+# Defines the location of the command to be in the DESIGN workspace and
+# in the CREATE panel below the Printable Bolt command. See the user manual topic
+# on "User Interface Customization" for details on how to get these ID's.
+# https://help.autodesk.com/cloudhelp/ENU/Fusion-360-API/files/UserInterface_UM.htm
+WORKSPACE_ID = 'FusionSolidEnvironment'
+PANEL_ID = 'SolidCreatePanel'
+COMMAND_BESIDE_ID = f'{config.COMPANY_NAME}_{config.ADDIN_NAME}_printableBoltCreate'
+
+# Local list of event handlers used to maintain a reference so
+# they are not released and garbage collected.
+local_handlers = []
+
+
+# Executed when the add-in is loaded. The button to execute the command
+# is created and the event handler to handle when the command is run is connected.
+def start():
+    global app, ui
+    app = adsk.core.Application.get()
+    ui = app.userInterface
+
+    # General logging for debug.
+    futil.log(f'{CMD_NAME} started')
+
+    # ******** Create the Command Definition ********
+    # Delete the existing command, in case it wasn't correctly deleted during a failed execution.
+    cmdDef = ui.commandDefinitions.itemById(CMD_ID)
+    if cmdDef:
+        cmdDef.deleteMe()
+
+    # Define the folder that contains the icon files. The edit command shares the icons of the create command.
+    icon_folder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'printableBoltCreate', 'resources')
+
+    # Create a command Definition.
+    cmd_def = ui.commandDefinitions.addButtonDefinition(CMD_ID, CMD_NAME, CMD_Description, icon_folder)
+
+    # Add the additional information for an extended tooltip.
+    imageFilename = os.path.join(icon_folder, '32x32.png')
+    cmd_def.toolClipFilename = imageFilename
+
+    # Define an event handler for the command created event. It will be called when the button is clicked.
+    futil.add_handler(cmd_def.commandCreated, command_created)
+
+    # ******** Add a button into the UI so the user can run the command. ********
+    # Get the target workspace the button will be created in.
+    workspace = ui.workspaces.itemById(WORKSPACE_ID)
+
+    # Get the panel the button will be created in.
+    panel = workspace.toolbarPanels.itemById(PANEL_ID)
+
+    # Create the button command control in the UI after the specified existing command.
+    control = panel.controls.addCommand(cmd_def, COMMAND_BESIDE_ID, False)
+
+    # Specify if the command is promoted to the main toolbar.
+    control.isPromoted = IS_PROMOTED
+
+
+
+# Executed when add-in is stopped.
+def stop():
+    # General logging for debug.
+    futil.log(f'{CMD_NAME} stopped')
+
+    # Gets the toolbar panel containing the button.
+    workspace = ui.workspaces.itemById(WORKSPACE_ID)
+    panel = workspace.toolbarPanels.itemById(PANEL_ID)
+
+    # Delete the button command control.
+    cntrl = panel.controls.itemById(CMD_ID)
+    if cntrl:
+        cntrl.deleteMe()
+
+    # Delete the command definition.
+    cmdDef = ui.commandDefinitions.itemById(CMD_ID)
+    if cmdDef:
+        cmdDef.deleteMe()
+
+
+# Function that is called when a user clicks the corresponding button in the UI.
+# This defines the contents of the command dialog and connects to the command related events.
+def command_created(args: adsk.core.CommandCreatedEventArgs):
+    # General logging for debug.
+    futil.log(f'{CMD_NAME} Command Created Event')
+
+    # Setup the event handlers needed for this command.
+    futil.add_handler(args.command.execute, command_execute, local_handlers=local_handlers)
+    futil.add_handler(args.command.inputChanged, command_input_changed, local_handlers=local_handlers)
+    futil.add_handler(args.command.executePreview, command_preview, local_handlers=local_handlers)
+    futil.add_handler(args.command.destroy, command_destroy, local_handlers=local_handlers)
+    futil.add_handler(args.command.validateInputs, command_validate_inputs, local_handlers=local_handlers)
+
+    des: adsk.fusion.Design = app.activeProduct
+    if des is None:
+        return
+
+    # Import the command logic on first use rather than when the add-in is loaded.
+    from . import logic
+
+    # Create an instance of the Edit Printable Bolt command class.
+    global printable_bolt_edit_logic
+    printable_bolt_edit_logic = logic.PrintableBoltEditLogic(des)
+
+    cmd = args.command
+    cmd.isExecutedWhenPreEmpted = False
+
+    # Define the dialog by creating the command inputs.
+    printable_bolt_edit_logic.CreateCommandInputs(cmd.commandInputs)
+
+
+# This event handler is called when the user clicks the OK button in the command dialog or
+# is immediately called after the created event not command inputs were created for the dialog.
+def command_execute(args: adsk.core.CommandEventArgs):
+    # General logging for debug.
+    futil.log(f'{CMD_NAME} Command Execute Event')
+
+    printable_bolt_edit_logic.HandleExecute(args)
+
+
+# This event handler is called when the command needs to compute a new preview in the graphics window.
+def command_preview(args: adsk.core.CommandEventArgs):
+    # General logging for debug.
+    futil.log(f'{CMD_NAME} Command Preview Event')
+
+    printable_bolt_edit_logic.HandleExecutePreview(args)
+
+
+# This event handler is called when the user changes anything in the command dialog
+# allowing you to modify values of other inputs based on that change.
+def command_input_changed(args: adsk.core.InputChangedEventArgs):
+    futil.log(f'{CMD_NAME} Input Changed Event fired from a change to {args.input.id}')
+
+    printable_bolt_edit_logic.HandleInputsChanged(args)
+
+
+# This event handler is called when the user interacts with any of the inputs in the dialog
+# which allows you to verify that all of the inputs are valid and enables the OK button.
+def command_validate_inputs(args: adsk.core.CommandEventArgs):
+    futil.log(f'{CMD_NAME} Validate Inputs Event fired.')
+
+    printable_bolt_edit_logic.HandleValidateInputs(args)
+
+
+# This event handler is called when the command terminates.
+def command_destroy(args: adsk.core.CommandEventArgs):
+    # General logging for debug.
+    futil.log(f'{CMD_NAME} Command Destroy Event')
+
+    global local_handlers
+    local_handlers = []
\ No newline at end of file
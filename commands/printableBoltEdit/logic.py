@@ -0,0 +1,168 @@
+import adsk.core
+import adsk.fusion
+
+from ..printableBoltCreate.printable_bolt import PrintableBolt, readSpec
+
+app = adsk.core.Application.get()
+ui = app.userInterface
+skipValidate = False
+
+
+class PrintableBoltEditLogic():
+    def __init__(self, des: adsk.fusion.Design):
+        self.design = des
+
+        defaultUnits = des.unitsManager.defaultLengthUnits
+
+        # Show the values in inches or millimeters, matching the create command.
+        if defaultUnits == 'in' or defaultUnits == 'ft':
+            self.units = 'in'
+        else:
+            self.units = 'mm'
+
+        # The component and spec of the selected bolt, set once a parameter driven bolt is selected.
+        self.component = None
+        self.spec = None
+
+    def CreateCommandInputs(self, inputs: adsk.core.CommandInputs):
+        global skipValidate
+        skipValidate = True
+
+        # Create the command inputs to define the contents of the command dialog.
+        self.boltSelectionInput = inputs.addSelectionInput('bolt', 'Bolt', 'Select a printable bolt built with user parameters')
+        self.boltSelectionInput.addSelectionFilter('Occurrences')
+        self.boltSelectionInput.setSelectionLimits(1, 1)
+
+        self.shaftDiameterValueInput = inputs.addValueInput('shaftDiameter', 'Shaft Diameter', self.units, adsk.core.ValueInput.createByReal(0))
+        self.shaftLengthValueInput = inputs.addValueInput('shaftLength', 'Shaft Length', self.units, adsk.core.ValueInput.createByReal(0))
+
+        self.backlashValueInput = inputs.addValueInput('backlash', 'Backlash', self.units, adsk.core.ValueInput.createByReal(0))
+
+        self.headDiameterValueInput = inputs.addValueInput('headDiameter', 'Head Diameter', self.units, adsk.core.ValueInput.createByReal(0))
+        self.headHeightValueInput = inputs.addValueInput('headHeight', 'Head Height', self.units, adsk.core.ValueInput.createByReal(0))
+
+        self.errorMessageTextInput = inputs.addTextBoxCommandInput('errMessage', '', '', 2, True)
+        self.errorMessageTextInput.isFullWidth = True
+
+        skipValidate = False
+
+    def HandleValidateInputs(self, args: adsk.core.ValidateInputsEventArgs):
+        if not skipValidate:
+            if self.component is None:
+                args.areInputsValid = False
+                return
+
+            self.errorMessageTextInput.text = ''
+
+            # Shaft length and diameter > 0
+            if not float(self.shaftLengthValueInput.value) > 0:
+                self.errorMessageTextInput.text = 'The shaft length must be greater than 0.'
+                args.areInputsValid = False
+                return
+
+            if not float(self.shaftDiameterValueInput.value) > 0:
+                self.errorMessageTextInput.text = 'The shaft diameter must be greater than 0.'
+                args.areInputsValid = False
+                return
+
+            # Backlash > 0, unless it isn't bound and can't be changed here
+            if self.backlashValueInput.isVisible and not float(self.backlashValueInput.value) > 0:
+                self.errorMessageTextInput.text = 'The backlash value must be greater than 0.'
+                args.areInputsValid = False
+                return
+
+            # Validations that should only happen if the bolt has a head:
+            if self.spec['headSides'] > 0:
+                # Head height > 0
+                if not float(self.headHeightValueInput.value) > 0:
+                    self.errorMessageTextInput.text = 'The head height must be greater than 0.'
+                    args.areInputsValid = False
+                    return
+
+                # Head diameter > shaft diameter
+                if not float(self.headDiameterValueInput.value) > float(self.shaftDiameterValueInput.value):
+                    self.errorMessageTextInput.text = 'The head diameter must be greater than the shaft diameter.'
+                    args.areInputsValid = False
+                    return
+
+    def HandleInputsChanged(self, args: adsk.core.InputChangedEventArgs):
+        changedInput = args.input
+
+        if not skipValidate:
+            if changedInput.id == 'bolt':
+                self.component = None
+                self.spec = None
+                self.errorMessageTextInput.text = ''
+
+                if self.boltSelectionInput.selectionCount == 0:
+                    return
+
+                occurrence = adsk.fusion.Occurrence.cast(self.boltSelectionInput.selection(0).entity)
+                spec = readSpec(occurrence.component)
+                if spec is None:
+                    self.errorMessageTextInput.text = 'The selected component is not a printable bolt.'
+                    return
+
+                if not spec.get('parameters'):
+                    self.errorMessageTextInput.text = 'The selected bolt was not built with user parameters and has to be regenerated.'
+                    return
+
+                self.component = occurrence.component
+                self.spec = spec
+
+                # Show the current parameter values, they may have been changed outside of this command.
+                values = {}
+                for name, parameterName in spec['parameters'].items():
+                    parameter = self.design.userParameters.itemByName(parameterName)
+                    values[name] = parameter.value if parameter is not None else spec[name]
+
+                self.shaftDiameterValueInput.value = values.get('bodyDiameter', spec['bodyDiameter'])
+                self.shaftLengthValueInput.value = values.get('bodyLength', spec['bodyLength'])
+                self.backlashValueInput.value = values.get('backlash', spec['backlash'])
+                self.headDiameterValueInput.value = values.get('headDiameter', spec['headDiameter'])
+                self.headHeightValueInput.value = values.get('headHeight', spec['headHeight'])
+
+                # Only the dimensions bound to user parameters can be changed, e.g. notched heads have no
+                # head diameter parameter.
+                inputs = {
+                    'bodyDiameter': self.shaftDiameterValueInput,
+                    'bodyLength': self.shaftLengthValueInput,
+                    'backlash': self.backlashValueInput,
+                    'headDiameter': self.headDiameterValueInput,
+                    'headHeight': self.headHeightValueInput,
+                }
+                for name, valueInput in inputs.items():
+                    valueInput.isVisible = name in spec['parameters']
+
+    def HandleExecutePreview(self, args: adsk.core.CommandEventArgs):
+        if self.component is None:
+            return
+
+        self.UpdateBolt()
+
+        # The parameter changes made by the preview are the final result, so skip the execute.
+        args.isValidResult = True
+
+    def HandleExecute(self, args: adsk.core.CommandEventArgs):
+        if self.component is None:
+            return
+
+        self.UpdateBolt()
+
+    def UpdateBolt(self):
+        printable_bolt = PrintableBolt(ui, app)
+
+        printable_bolt.headSides = self.spec['headSides']
+
+        printable_bolt.bodyDiameter = float(self.shaftDiameterValueInput.value)
+        printable_bolt.bodyLength = adsk.core.ValueInput.createByReal(float(self.shaftLengthValueInput.value))
+
+        printable_bolt.headDiameter = float(self.headDiameterValueInput.value)
+        printable_bolt.headHeight = float(self.headHeightValueInput.value)
+
+        printable_bolt.backlash = adsk.core.ValueInput.createByReal(float(self.backlashValueInput.value))
+
+        pitch = self.spec.get('pitch')
+        changed = printable_bolt.updateBolt(self.component)
+        if 'pitch' in changed:
+            self.errorMessageTextInput.text = f'There is no {pitch * 10:g} mm pitch thread for this shaft diameter, the recommended thread is used.'
@@ -18,4 +18,12 @@ ADDIN_NAME = os.path.basename(os.path.dirname(__file__))
 COMPANY_NAME = 'ACME'
 
 # Palettes
-sample_palette_id = f'{COMPANY_NAME}_{ADDIN_NAME}_palette_id'
\ No newline at end of file
+sample_palette_id = f'{COMPANY_NAME}_{ADDIN_NAME}_palette_id'
+
+# Every bolt preview and build appends a record of its duration and outcome to this journal. It is
+# rotated once it grows past JOURNAL_MAX_BYTES, keeping JOURNAL_BACKUPS older files. Print a summary
+# with: python commands/printableBoltCreate/journal.py
+JOURNAL_ENABLED = True
+JOURNAL_PATH = os.path.join(os.path.expanduser('~'), '.printable_bolt', 'builds.jsonl')
+JOURNAL_MAX_BYTES = 5 * 1024 * 1024
+JOURNAL_BACKUPS = 3
@@ -0,0 +1,5 @@
+# Fusion independent bolt geometry, kept free of adsk imports so it can run off the main thread and outside Fusion.
+from . import head_profiles
+from . import mesh
+from . import spec
+from . import thread_table
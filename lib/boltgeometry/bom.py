@@ -0,0 +1,306 @@
+import csv
+import io
+import re
+import zipfile
+from fractions import Fraction
+from typing import NamedTuple
+from xml.etree import ElementTree
+
+from . import spec as bolt_spec
+from . import thread_table
+
+
+# Proportions of the bolt head to the shaft diameter, close to an ISO 4017 hex head bolt.
+HEAD_DIAMETER_RATIO = 1.8
+HEAD_HEIGHT_RATIO = 0.7
+
+# Header names of the BOM columns, compared in lower case.
+SIZE_COLUMNS = ['size', 'thread', 'designation', 'description', 'part description', 'name', 'item']
+QUANTITY_COLUMNS = ['qty', 'quantity', 'count', 'amount']
+PART_NUMBER_COLUMNS = ['part number', 'part no', 'part no.', 'part #', 'pn', 'part', 'item number']
+
+# "M5x20", "M5 x 20 mm" or "M5x0.8x20", the middle number being the pitch.
+METRIC_SIZE = re.compile(
+    r'\bM(?P<size>\d+(?:\.\d+)?)'
+    r'(?:\s*[x×]\s*(?P<pitch>\d+(?:\.\d+)?)(?=\s*[x×]))?'
+    r'\s*[x×]\s*(?P<length>\d+(?:\.\d+)?)\s*(?:mm)?',
+    re.IGNORECASE)
+
+# '1/4-20 x 1"', '#10-24 x 3/4', '1/4"-20 UNC x 1-1/2"', '1/2-13 UNC-2A x 2' or '5/16-18 x 1.25 in'.
+UNIFIED_SIZE = re.compile(
+    r'(?P<size>#\d+|\d+/\d+|\d+(?:\.\d+)?)\s*"?\s*-\s*(?P<tpi>\d+)\s*(?:UN[CFE]?F?)?(?:\s*-?\s*[123][AB]\b)?'
+    r'\s*[x×]\s*(?P<length>\d+[- ]\d+/\d+|\d+/\d+|\d*\.?\d+)\s*(?:"|in\b|inch\b)?',
+    re.IGNORECASE)
+
+
+class FastenerSize(NamedTuple):
+    """A fastener size read from a BOM, in centimeters. The pitch is None for the coarse pitch of the size."""
+    designation: str
+    diameter: float
+    pitch: float
+    length: float
+    standard: str
+
+
+class BomLine(NamedTuple):
+    part_number: str
+    text: str
+    quantity: int
+    size: FastenerSize
+
+
+class UniqueSpec(NamedTuple):
+    """A bolt spec with every BOM line that asks for it."""
+    spec: dict
+    spec_hash: str
+    quantity: int
+    lines: list
+
+
+def parse_size(text: str):
+    """Returns the FastenerSize named in a piece of text, or None if it names none.
+
+    Metric sizes are read as M<size>x<length> or M<size>x<pitch>x<length> in millimeters and unified
+    sizes as <size>-<threads per inch> x <length> in inches, with numbered and fractional sizes. Only
+    sizes and pitches of the ISO coarse and fine and the unified coarse and fine series count, so other
+    text such as "Rev 2-3 x 4" isn't taken for a bolt, and neither is a nut named by its thread like
+    "Hex nut M6x1".
+    """
+    for match in METRIC_SIZE.finditer(text):
+        size = metric_size(match)
+        if size is not None:
+            return size
+
+    for match in UNIFIED_SIZE.finditer(text):
+        size = unified_size(match)
+        if size is not None:
+            return size
+
+    return None
+
+
+def metric_size(match):
+    size = float(match.group('size'))
+    diameter = size * thread_table.MM
+    coarse = thread_table.find_thread(thread_table.ISO_METRIC_COARSE, diameter)
+    if coarse is None:
+        return None
+
+    # A lone M<size>x<pitch> names a thread, not a bolt length.
+    length = float(match.group('length')) * thread_table.MM
+    if not match.group('pitch') and is_metric_pitch(diameter, length):
+        return None
+
+    # A pitch that is the coarse pitch of the size is the standard thread.
+    pitch = float(match.group('pitch')) * thread_table.MM if match.group('pitch') else None
+    if pitch is not None and not is_metric_pitch(diameter, pitch):
+        return None
+    if pitch is not None and abs(coarse.pitch - pitch) < 1e-9:
+        pitch = None
+    designation = f'M{size:g}x{float(match.group("pitch")):g}' if pitch is not None else f'M{size:g}'
+    return FastenerSize(designation, diameter, pitch, length, 'Metric')
+
+
+def is_metric_pitch(diameter: float, pitch: float) -> bool:
+    """Whether a pitch is the coarse or one of the fine ISO pitches of a size."""
+    return thread_table.find_thread(thread_table.ISO_METRIC_COARSE + thread_table.ISO_METRIC_FINE, diameter, pitch) is not None
+
+
+def unified_size(match):
+    size = match.group('size')
+    # A bare number up to 12 is more likely a numbered size, "10-24" being #10-24, but "1-8" is 1"-8.
+    names = [size]
+    if size.isdigit() and int(size) <= 12:
+        names.insert(0, f'#{size}')
+
+    pitch = thread_table.INCH / int(match.group('tpi'))
+    for name in names:
+        diameter = thread_table.unified_size_inches(name) * thread_table.INCH
+        thread = thread_table.find_thread(thread_table.UNIFIED_COARSE + thread_table.UNIFIED_FINE, diameter, pitch)
+        if thread is not None:
+            # The coarse series is the recommended thread of the size, like the coarse metric pitch.
+            return FastenerSize(thread.designation, thread.diameter,
+                                None if thread in thread_table.UNIFIED_COARSE else thread.pitch,
+                                parse_inches(match.group('length')) * thread_table.INCH, 'English')
+
+    return None
+
+
+def parse_inches(text: str) -> float:
+    """Reads a length in inches such as "1", ".75", "3/4" or "1-1/2"."""
+    whole, _, fraction = text.replace(' ', '-').partition('-')
+    if fraction:
+        return int(whole) + float(Fraction(fraction))
+    return float(Fraction(whole))
+
+
+def size_spec(size: FastenerSize, backlash: float = 0.0) -> dict:
+    """Returns the canonical bolt spec of a fastener size, with a hex head proportioned to the shaft."""
+    return {
+        'boltName':       size.designation,
+        'headDiameter':   size.diameter * HEAD_DIAMETER_RATIO,
+        'headHeight':     size.diameter * HEAD_HEIGHT_RATIO,
+        'headSides':      6,
+        'headProfile':    'Hex',
+        'bodyDiameter':   size.diameter,
+        'bodyLength':     size.length,
+        'backlash':       backlash,
+        'pitch':          size.pitch,
+        'threadStarts':   1,
+        'threadAngle':    60.0,
+        'threadStandard': size.standard,
+    }
+
+
+def read_rows(path: str):
+    """Returns the rows of a CSV file or of the first sheet of an Excel workbook as lists of strings."""
+    if path.lower().endswith(('.xlsx', '.xlsm')):
+        with open(path, 'rb') as workbook_file:
+            return read_xlsx_rows(workbook_file.read())
+
+    with open(path, encoding='utf-8-sig', newline='') as csv_file:
+        text = csv_file.read()
+    try:
+        dialect = csv.Sniffer().sniff(text[:4096], delimiters=',;\t')
+    except csv.Error:
+        dialect = csv.excel
+    return [row for row in csv.reader(io.StringIO(text), dialect)]
+
+
+def read_xlsx_rows(data: bytes):
+    """Returns the rows of the first sheet of an .xlsx workbook as lists of strings.
+
+    The workbook is read as the zipped XML it is, so reading a BOM needs no spreadsheet package.
+    """
+    ns = {'main': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main',
+          'rel': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships',
+          'pkg': 'http://schemas.openxmlformats.org/package/2006/relationships'}
+
+    with zipfile.ZipFile(io.BytesIO(data)) as workbook:
+        names = set(workbook.namelist())
+
+        shared = []
+        if 'xl/sharedStrings.xml' in names:
+            for item in ElementTree.fromstring(workbook.read('xl/sharedStrings.xml')).findall('main:si', ns):
+                shared.append(''.join(node.text or '' for node in item.iter(f'{{{ns["main"]}}}t')))
+
+        # The first sheet of the workbook, found through its relationship.
+        sheet_path = 'xl/worksheets/sheet1.xml'
+        if 'xl/workbook.xml' in names and 'xl/_rels/workbook.xml.rels' in names:
+            sheet = ElementTree.fromstring(workbook.read('xl/workbook.xml')).find('main:sheets/main:sheet', ns)
+            relations = ElementTree.fromstring(workbook.read('xl/_rels/workbook.xml.rels'))
+            if sheet is not None:
+                relation_id = sheet.get(f'{{{ns["rel"]}}}id')
+                for relation in relations.findall('pkg:Relationship', ns):
+                    if relation.get('Id') == relation_id:
+                        target = relation.get('Target')
+                        sheet_path = target.lstrip('/') if target.startswith('/') else f'xl/{target}'
+
+        rows = []
+        for row in ElementTree.fromstring(workbook.read(sheet_path)).iter(f'{{{ns["main"]}}}row'):
+            values = {}
+            for cell in row.findall('main:c', ns):
+                column = column_index(cell.get('r')) if cell.get('r') else len(values)
+                kind = cell.get('t')
+                if kind == 'inlineStr':
+                    value = ''.join(node.text or '' for node in cell.iter(f'{{{ns["main"]}}}t'))
+                else:
+                    node = cell.find('main:v', ns)
+                    value = node.text if node is not None and node.text is not None else ''
+                    if kind == 's' and value:
+                        value = shared[int(value)]
+                values[column] = value
+            rows.append([values.get(index, '') for index in range(max(values) + 1)] if values else [])
+        return rows
+
+
+def column_index(reference: str) -> int:
+    """Returns the zero based column of a cell reference such as "B7"."""
+    index = 0
+    for letter in re.match(r'[A-Z]+', reference.upper()).group(0):
+        index = index * 26 + ord(letter) - ord('A') + 1
+    return index - 1
+
+
+def parse_bom(rows):
+    """Returns the fastener lines of a BOM and the lines that name no fastener size.
+
+    The first row holding a size or description column is taken as the header. Sizes are read from
+    the size columns first, so a part number that looks like a size doesn't win over the description.
+
+    Arguments:
+    rows -- The rows of the BOM as lists of strings, as returned by read_rows.
+    """
+    header_index, columns = find_header(rows)
+    lines = []
+    skipped = []
+
+    for row in rows[header_index + 1:]:
+        cells = [str(cell).strip() for cell in row]
+        if not any(cells):
+            continue
+
+        def cell(names):
+            for name in names:
+                index = columns.get(name)
+                if index is not None and index < len(cells) and cells[index]:
+                    return cells[index]
+            return ''
+
+        text = cell(SIZE_COLUMNS)
+        size = parse_size(text) if text else None
+        if size is None:
+            size = parse_size(' '.join(cells))
+        if size is None:
+            skipped.append(text or ' '.join(cells))
+            continue
+
+        lines.append(BomLine(cell(PART_NUMBER_COLUMNS), text, parse_quantity(cell(QUANTITY_COLUMNS)), size))
+
+    return lines, skipped
+
+
+def find_header(rows):
+    """Returns the index of the header row and its column index per lower case name."""
+    for index, row in enumerate(rows):
+        names = {str(cell).strip().lower(): column for column, cell in reversed(list(enumerate(row))) if str(cell).strip()}
+        if any(name in names for name in SIZE_COLUMNS):
+            return index, names
+    # Without a header every row is a line and the size is searched for in all of its cells.
+    return -1, {}
+
+
+def parse_quantity(text: str) -> int:
+    """Reads a BOM quantity from its leading number, like "4", "2 pcs" or "1,000". An empty or unreadable
+    quantity counts as one.
+    """
+    match = re.match(r'\s*(\d[\d,]*(?:\.\d+)?)', text)
+    if match is None:
+        return 1
+    return int(round(float(match.group(1).replace(',', ''))))
+
+
+def unique_specs(entries):
+    """Merges specs that describe the same geometry, keyed by their spec hash.
+
+    Returns the unique specs in the order they first appear, each with the total quantity and the
+    entries that asked for it.
+
+    Arguments:
+    entries -- (spec, quantity, source) tuples, the source being anything that identifies the entry.
+    """
+    index = {}
+    for spec, quantity, source in entries:
+        key = bolt_spec.spec_hash(spec)
+        if key not in index:
+            index[key] = UniqueSpec(spec, key, 0, [])
+        index[key] = index[key]._replace(quantity=index[key].quantity + quantity)
+        index[key].lines.append(source)
+    return list(index.values())
+
+
+def bom_specs(path: str, backlash: float = 0.0):
+    """Reads a BOM file and returns its unique bolt specs and the lines that name no fastener size."""
+    lines, skipped = parse_bom(read_rows(path))
+    entries = [(size_spec(line.size, backlash), line.quantity, line) for line in lines]
+    return unique_specs(entries), skipped
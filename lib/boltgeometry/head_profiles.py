@@ -0,0 +1,115 @@
+import math
+from functools import lru_cache
+from typing import NamedTuple
+
+
+class HeadProfile(NamedTuple):
+    """Describes the shape of a bolt head as a single extruded outline.
+
+    The head diameter of a bolt is the diameter of the circle its outline is inscribed in.
+    """
+    name: str
+    # The vertices around the outline, 0 uses the side count of the bolt.
+    sides: int = 0
+    # A round outline is built as a circle where it can be and sampled with `sides` vertices for meshes.
+    round: bool = False
+    # Circular notches cut into the rim, as used for knurls and thumb grips.
+    notches: int = 0
+    notch_ratio: float = 0.0
+    # A polygonal socket through the head, sized by its corner diameter relative to the head diameter.
+    socket_sides: int = 0
+    socket_ratio: float = 0.0
+    # A round flange at the bottom of the head, sized relative to the head diameter and height.
+    flange_ratio: float = 0.0
+    flange_height_ratio: float = 0.0
+
+    @property
+    def is_regular(self) -> bool:
+        """Whether the outline is a plain regular polygon or circle that a sketch can dimension."""
+        return self.notches == 0
+
+
+HEAD_PROFILES = {profile.name: profile for profile in [
+    HeadProfile('Polygon'),
+    HeadProfile('Hex', sides=6),
+    HeadProfile('Square', sides=4),
+    HeadProfile('Round Knurled', sides=240, round=True, notches=40, notch_ratio=0.04),
+    HeadProfile('Flanged', sides=6, flange_ratio=1.25, flange_height_ratio=0.25),
+    HeadProfile('Socket Cap', sides=96, round=True, socket_sides=6, socket_ratio=0.5),
+    HeadProfile('Thumbscrew', sides=96, round=True, notches=6, notch_ratio=0.3),
+]}
+
+DEFAULT_HEAD_PROFILE = 'Polygon'
+
+
+@lru_cache(maxsize=None)
+def unit_circle(sides: int):
+    """Returns the (cos, sin) of the vertices of a regular polygon, the first vertex at angle 0."""
+    step = 2 * math.pi / sides
+    return tuple((math.cos(i * step), math.sin(i * step)) for i in range(sides))
+
+
+@lru_cache(maxsize=None)
+def unit_polygon_radii(polygon_sides: int, samples: int):
+    """Returns the distance to a regular polygon of unit corner radius at each vertex angle of unit_circle(samples).
+
+    Sampling a polygon at the angles of a finer circle lets it be stitched vertex to vertex to that circle.
+    """
+    half = math.pi / polygon_sides
+    apothem = math.cos(half)
+    step = 2 * math.pi / samples
+    return tuple(apothem / math.cos((i * step) % (2 * half) - half) for i in range(samples))
+
+
+@lru_cache(maxsize=None)
+def unit_notched_radii(notches: int, notch_ratio: float, samples: int):
+    """Returns the distance to a unit circle with circular notches cut into its rim at each vertex angle of
+    unit_circle(samples).
+    """
+    pitch = 2 * math.pi / notches
+    step = 2 * math.pi / samples
+    radii = []
+    for i in range(samples):
+        # The angle to the closest notch center.
+        offset = (i * step + pitch / 2) % pitch - pitch / 2
+        reach = notch_ratio ** 2 - math.sin(offset) ** 2
+        radius = 1.0
+        if reach > 0:
+            radius = min(radius, math.cos(offset) - math.sqrt(reach))
+        radii.append(radius)
+    return tuple(radii)
+
+
+@lru_cache(maxsize=None)
+def unit_outline(name: str, sides: int):
+    """Returns the counterclockwise (x, y) outline of a head profile with a unit corner radius.
+
+    Arguments:
+    name -- The name of the head profile.
+    sides -- The side count to use for profiles that take it from the bolt.
+    """
+    profile = HEAD_PROFILES[name]
+    count = profile.sides or sides
+    circle = unit_circle(count)
+    if profile.notches:
+        radii = unit_notched_radii(profile.notches, profile.notch_ratio, count)
+        return tuple((x * r, y * r) for (x, y), r in zip(circle, radii))
+    return circle
+
+
+@lru_cache(maxsize=None)
+def unit_socket(name: str, sides: int):
+    """Returns the counterclockwise (x, y) socket of a head profile with a unit head corner radius, sampled
+    at the same angles as its outline, or None if the profile has no socket.
+    """
+    profile = HEAD_PROFILES[name]
+    if not profile.socket_sides:
+        return None
+    count = profile.sides or sides
+    radii = unit_polygon_radii(profile.socket_sides, count)
+    return tuple((x * r * profile.socket_ratio, y * r * profile.socket_ratio) for (x, y), r in zip(unit_circle(count), radii))
+
+
+def scale(points, factor: float):
+    """Scales (x, y) points about the origin."""
+    return [(x * factor, y * factor) for x, y in points]
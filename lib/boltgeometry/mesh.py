@@ -0,0 +1,297 @@
+import math
+from typing import NamedTuple
+
+from . import head_profiles
+
+
+# Level of detail used for previews, in segments around a full turn.
+PREVIEW_SEGMENTS = 32
+PREVIEW_THREAD_SEGMENTS = 24
+
+# Level of detail used for threads that are added to a design as mesh bodies.
+EXPORT_THREAD_SEGMENTS = 64
+
+# Ratio of the thread depth to the height of the fundamental triangle of an ISO 68-1 thread.
+THREAD_DEPTH_RATIO = 5 / 8
+
+
+class Mesh:
+    """An indexed triangle mesh.
+
+    The coordinates are a flat list of x, y, z values and the indices a flat list of three vertex
+    indices per triangle, the layout taken by CustomGraphicsCoordinates.create and addMesh.
+    Triangles are wound counterclockwise when seen from outside the mesh.
+    """
+
+    def __init__(self):
+        self.coordinates = []
+        self.indices = []
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.coordinates) // 3
+
+    @property
+    def triangle_count(self) -> int:
+        return len(self.indices) // 3
+
+    def add_vertices(self, points) -> int:
+        """Adds (x, y, z) points and returns the index of the first one."""
+        first = self.vertex_count
+        for point in points:
+            self.coordinates.extend(point)
+        return first
+
+    def extend(self, other: 'Mesh'):
+        """Appends the vertices and triangles of another mesh to this one."""
+        offset = self.vertex_count
+        self.coordinates.extend(other.coordinates)
+        self.indices.extend(index + offset for index in other.indices)
+
+
+class BoltMesh(NamedTuple):
+    head: Mesh
+    shaft: Mesh
+    thread: Mesh
+
+    @property
+    def triangle_count(self) -> int:
+        return self.head.triangle_count + self.shaft.triangle_count + self.thread.triangle_count
+
+    def combined(self) -> Mesh:
+        """Returns the head, shaft and thread as a single mesh."""
+        mesh = Mesh()
+        for part in self:
+            mesh.extend(part)
+        return mesh
+
+
+def circle_outline(radius: float, segments: int):
+    """Returns the counterclockwise (x, y) vertices of a regular polygon inscribed in a circle."""
+    return head_profiles.scale(head_profiles.unit_circle(segments), radius)
+
+
+def prism(outline, z_bottom: float, z_top: float) -> Mesh:
+    """Returns a closed prism extruded from a counterclockwise outline.
+
+    Arguments:
+    outline -- The (x, y) vertices of the outline. It must be star shaped around the origin
+               since the caps are fanned from there.
+    z_bottom -- The height of the bottom cap.
+    z_top -- The height of the top cap.
+    """
+    mesh = Mesh()
+    count = len(outline)
+
+    bottom = mesh.add_vertices((x, y, z_bottom) for x, y in outline)
+    top = mesh.add_vertices((x, y, z_top) for x, y in outline)
+    bottom_center = mesh.add_vertices([(0.0, 0.0, z_bottom)])
+    top_center = mesh.add_vertices([(0.0, 0.0, z_top)])
+
+    for i in range(count):
+        j = (i + 1) % count
+        mesh.indices.extend((bottom + i, bottom + j, top + j))
+        mesh.indices.extend((bottom + i, top + j, top + i))
+        mesh.indices.extend((bottom_center, bottom + j, bottom + i))
+        mesh.indices.extend((top_center, top + i, top + j))
+
+    return mesh
+
+
+def annular_prism(outer, inner, z_bottom: float, z_top: float) -> Mesh:
+    """Returns a closed prism extruded from an outline with a hole through it.
+
+    Arguments:
+    outer -- The counterclockwise (x, y) vertices of the outline.
+    inner -- The counterclockwise (x, y) vertices of the hole, one for every outline vertex.
+    z_bottom -- The height of the bottom face.
+    z_top -- The height of the top face.
+    """
+    mesh = Mesh()
+    count = len(outer)
+
+    outer_bottom = mesh.add_vertices((x, y, z_bottom) for x, y in outer)
+    outer_top = mesh.add_vertices((x, y, z_top) for x, y in outer)
+    inner_bottom = mesh.add_vertices((x, y, z_bottom) for x, y in inner)
+    inner_top = mesh.add_vertices((x, y, z_top) for x, y in inner)
+
+    for i in range(count):
+        j = (i + 1) % count
+        mesh.indices.extend((outer_bottom + i, outer_bottom + j, outer_top + j))
+        mesh.indices.extend((outer_bottom + i, outer_top + j, outer_top + i))
+        mesh.indices.extend((inner_bottom + i, inner_top + j, inner_bottom + j))
+        mesh.indices.extend((inner_bottom + i, inner_top + i, inner_top + j))
+        mesh.indices.extend((outer_bottom + i, inner_bottom + j, outer_bottom + j))
+        mesh.indices.extend((outer_bottom + i, inner_bottom + i, inner_bottom + j))
+        mesh.indices.extend((outer_top + i, outer_top + j, inner_top + j))
+        mesh.indices.extend((outer_top + i, inner_top + j, inner_top + i))
+
+    return mesh
+
+
+def head(profile_name: str, diameter: float, height: float, sides: int = 6) -> Mesh:
+    """Returns the mesh of a bolt head standing on the XY plane.
+
+    Arguments:
+    profile_name -- The name of the head profile, see head_profiles.HEAD_PROFILES.
+    diameter -- The diameter of the circle the head outline is inscribed in.
+    height -- The height of the head.
+    sides -- The side count for profiles that take it from the bolt.
+    """
+    profile = head_profiles.HEAD_PROFILES[profile_name]
+    radius = diameter / 2
+    outer = head_profiles.scale(head_profiles.unit_outline(profile_name, sides), radius)
+    socket = head_profiles.unit_socket(profile_name, sides)
+
+    if socket:
+        mesh = annular_prism(outer, head_profiles.scale(socket, radius), 0.0, height)
+    else:
+        mesh = prism(outer, 0.0, height)
+
+    if profile.flange_ratio:
+        flange = circle_outline(radius * profile.flange_ratio, len(outer) * 4)
+        mesh.extend(prism(flange, 0.0, height * profile.flange_height_ratio))
+
+    return mesh
+
+
+def thread_profile(diameter: float, pitch: float, backlash: float = 0.0, angle: float = 60.0):
+    """Returns the root radius, crest radius and root width of a printable external thread.
+
+    The thread has the depth of an ISO 68-1 external thread and a sharp crest that is pulled in by
+    the backlash. The root width is capped at the pitch so neighbouring turns never overlap.
+
+    Arguments:
+    diameter -- The major diameter of the thread.
+    pitch -- The distance between neighbouring turns.
+    backlash -- The clearance taken off the crest.
+    angle -- The included angle between the flanks in degrees.
+    """
+    half_angle = math.radians(angle) / 2
+    depth = THREAD_DEPTH_RATIO * pitch / (2 * math.tan(half_angle))
+    root = diameter / 2 - depth
+    crest = max(diameter / 2 - backlash, root)
+    width = min(2 * (crest - root) * math.tan(half_angle), pitch)
+    return root, crest, width
+
+
+def helical_sweep(profile, lead: float, turns: float, z_start: float, segments_per_turn: int,
+                  start_angle: float = 0.0) -> Mesh:
+    """Returns a closed mesh of a profile swept along a helix around the z axis.
+
+    Arguments:
+    profile -- The (r, z) vertices of the profile, counterclockwise in the r-z plane.
+    lead -- The distance the profile rises per turn.
+    turns -- The number of turns to sweep.
+    z_start -- The height the sweep starts at.
+    segments_per_turn -- The number of steps per turn.
+    start_angle -- The angle around the z axis the sweep starts at, in radians.
+    """
+    mesh = Mesh()
+    count = len(profile)
+    steps = max(1, int(math.ceil(turns * segments_per_turn)))
+    angle_step = 2 * math.pi * turns / steps
+    rise_step = lead * turns / steps
+
+    for k in range(steps + 1):
+        angle = start_angle + k * angle_step
+        cos, sin = math.cos(angle), math.sin(angle)
+        z = z_start + k * rise_step
+        mesh.add_vertices((r * cos, r * sin, z + dz) for r, dz in profile)
+
+    for k in range(steps):
+        ring = k * count
+        following = ring + count
+        for a in range(count):
+            b = (a + 1) % count
+            mesh.indices.extend((ring + a, following + b, ring + b))
+            mesh.indices.extend((ring + a, following + a, following + b))
+
+    # Fan the end caps, the start cap faces back along the sweep.
+    last = steps * count
+    for a in range(1, count - 1):
+        mesh.indices.extend((0, a, a + 1))
+        mesh.indices.extend((last, last + a + 1, last + a))
+
+    return mesh
+
+
+def thread(diameter: float, pitch: float, length: float, z_start: float, backlash: float = 0.0,
+           angle: float = 60.0, starts: int = 1, segments_per_turn: int = PREVIEW_THREAD_SEGMENTS) -> Mesh:
+    """Returns the ridges of an external thread that fit within a length of shaft.
+
+    Arguments:
+    diameter -- The major diameter of the thread.
+    pitch -- The distance between neighbouring turns.
+    length -- The length of shaft the thread has to fit in.
+    z_start -- The height of the bottom of the threaded length.
+    backlash -- The clearance taken off the crest.
+    angle -- The included angle between the flanks in degrees.
+    starts -- The number of intertwined thread ridges.
+    segments_per_turn -- The number of steps per turn.
+    """
+    mesh = Mesh()
+    root, crest, width = thread_profile(diameter, pitch, backlash, angle)
+    lead = pitch * starts
+    turns = (length - width) / lead
+    if turns <= 0 or crest <= root:
+        return mesh
+
+    profile = [(root, -width / 2), (crest, 0.0), (root, width / 2)]
+    for start in range(starts):
+        mesh.extend(helical_sweep(profile, lead, turns, z_start + width / 2, segments_per_turn,
+                                  2 * math.pi * start / starts))
+    return mesh
+
+
+def thread_triangle_count(diameter: float, pitch: float, length: float, backlash: float = 0.0, angle: float = 60.0,
+                          starts: int = 1, segments_per_turn: int = PREVIEW_THREAD_SEGMENTS) -> int:
+    """Returns the number of triangles thread() makes for the same arguments, without building the mesh."""
+    root, crest, width = thread_profile(diameter, pitch, backlash, angle)
+    turns = (length - width) / (pitch * starts)
+    if turns <= 0 or crest <= root:
+        return 0
+    # Two triangles per profile edge and step around the helix and one to close each end of the sweep.
+    steps = max(1, int(math.ceil(turns * segments_per_turn)))
+    return starts * (6 * steps + 2)
+
+
+def bolt(head_diameter: float, head_height: float, head_sides: int, body_diameter: float, body_length: float,
+         pitch: float = None, backlash: float = 0.0, segments: int = PREVIEW_SEGMENTS,
+         thread_segments: int = PREVIEW_THREAD_SEGMENTS,
+         head_profile: str = head_profiles.DEFAULT_HEAD_PROFILE,
+         thread_starts: int = 1, thread_angle: float = 60.0) -> BoltMesh:
+    """Returns the mesh of a bolt laid out like PrintableBolt builds it.
+
+    The head sits on the XY plane and the shaft points down the negative z axis. Without a head a
+    small base of a hundredth of the shaft diameter is used, like the feature based build does.
+
+    Arguments:
+    head_diameter -- The diameter of the circle the head polygon is inscribed in.
+    head_height -- The height of the head.
+    head_sides -- The number of sides of a polygon head, 0 for a headless bolt.
+    body_diameter -- The major diameter of the shaft.
+    body_length -- The length of the shaft.
+    pitch -- The thread pitch, or None for an unthreaded shaft.
+    backlash -- The clearance taken off the thread crest.
+    segments -- The number of segments around the shaft.
+    thread_segments -- The number of steps per turn of the thread.
+    head_profile -- The name of the head profile, see head_profiles.HEAD_PROFILES.
+    thread_starts -- The number of intertwined thread ridges.
+    thread_angle -- The included angle between the thread flanks in degrees.
+    """
+    if head_sides > 0:
+        bolt_head = head(head_profile, head_diameter, head_height, head_sides)
+    else:
+        bolt_head = prism(circle_outline(body_diameter / 100, segments), 0.0, head_height)
+
+    if pitch:
+        root, _, _ = thread_profile(body_diameter, pitch, backlash, thread_angle)
+        shaft = prism(circle_outline(root, segments), -body_length, 0.0)
+        ridges = thread(body_diameter, pitch, body_length, -body_length, backlash, thread_angle, thread_starts,
+                        thread_segments)
+    else:
+        shaft = prism(circle_outline(body_diameter / 2, segments), -body_length, 0.0)
+        ridges = Mesh()
+
+    return BoltMesh(bolt_head, shaft, ridges)
@@ -0,0 +1,64 @@
+import hashlib
+import json
+
+from . import mesh, thread_table
+
+
+# Spec fields that don't change the geometry of a bolt and are left out of its hash.
+UNHASHED_FIELDS = {'boltName', 'parameters'}
+
+
+def spec_hash(spec: dict) -> str:
+    """Returns a short stable hash of the geometry a bolt spec describes.
+
+    Lengths are rounded to a nanometer so values that only differ by floating point noise hash the same.
+    """
+    canonical = {
+        key: round(value, 7) if isinstance(value, float) else value
+        for key, value in spec.items() if key not in UNHASHED_FIELDS
+    }
+    return hashlib.sha1(json.dumps(canonical, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+
+
+def is_recommended_thread(spec: dict) -> bool:
+    """Whether a spec asks for the standard single start 60 degree thread of its shaft diameter."""
+    return (spec.get('pitch') is None and spec.get('threadStarts', 1) == 1
+            and abs(spec.get('threadAngle', 60.0) - 60.0) < 1e-9)
+
+
+def is_standard_thread(spec: dict) -> bool:
+    """Whether Fusion's thread table can be expected to have the thread of a spec, a single start 60 degree
+    thread with the recommended pitch or a coarse or fine pitch of its size.
+    """
+    if spec.get('threadStarts', 1) != 1 or abs(spec.get('threadAngle', 60.0) - 60.0) > 1e-9:
+        return False
+    if spec.get('pitch') is None:
+        return True
+    sizes = thread_table.standard_threads(spec.get('threadStandard', 'Metric'))
+    return thread_table.find_thread(sizes, spec['bodyDiameter'], spec['pitch']) is not None
+
+
+def thread_pitch(spec: dict) -> float:
+    """Returns the pitch override of a spec or the coarse pitch of the nearest size of its thread standard."""
+    if spec.get('pitch') is not None:
+        return spec['pitch']
+    return thread_table.nearest_thread(spec['bodyDiameter'], spec.get('threadStandard', 'Metric')).pitch
+
+
+def thread_mesh(spec: dict, segments_per_turn: int = mesh.EXPORT_THREAD_SEGMENTS) -> mesh.Mesh:
+    """Returns the thread ridges of a spec along its whole shaft, as added to bolts whose thread
+    Fusion can't model.
+    """
+    length = spec['bodyLength']
+    return mesh.thread(
+        spec['bodyDiameter'], thread_pitch(spec), length, -length, spec.get('backlash', 0.0),
+        spec.get('threadAngle', 60.0), spec.get('threadStarts', 1), segments_per_turn
+    )
+
+
+def thread_triangle_count(spec: dict, segments_per_turn: int = mesh.EXPORT_THREAD_SEGMENTS) -> int:
+    """Returns the number of triangles thread_mesh would make for a spec, without building it."""
+    return mesh.thread_triangle_count(
+        spec['bodyDiameter'], thread_pitch(spec), spec['bodyLength'], spec.get('backlash', 0.0),
+        spec.get('threadAngle', 60.0), spec.get('threadStarts', 1), segments_per_turn
+    )
@@ -0,0 +1,115 @@
+from fractions import Fraction
+from typing import NamedTuple
+
+
+# All sizes are in centimeters, the internal length unit of Fusion 360.
+MM = 0.1
+INCH = 2.54
+
+
+class ThreadSize(NamedTuple):
+    designation: str
+    diameter: float
+    pitch: float
+    standard: str
+
+
+# ISO 261 coarse pitch series.
+ISO_METRIC_COARSE = [
+    ThreadSize(f'M{size:g}x{pitch:g}', size * MM, pitch * MM, 'Metric')
+    for size, pitch in [
+        (1, 0.25), (1.2, 0.25), (1.4, 0.3), (1.6, 0.35), (2, 0.4), (2.5, 0.45), (3, 0.5), (3.5, 0.6),
+        (4, 0.7), (5, 0.8), (6, 1.0), (8, 1.25), (10, 1.5), (12, 1.75), (14, 2.0), (16, 2.0),
+        (18, 2.5), (20, 2.5), (22, 2.5), (24, 3.0), (27, 3.0), (30, 3.5), (33, 3.5), (36, 4.0),
+        (39, 4.0), (42, 4.5), (45, 4.5), (48, 5.0), (52, 5.0), (56, 5.5), (60, 5.5), (64, 6.0),
+    ]
+]
+
+# ISO 261 fine pitch series, every fine pitch of a size.
+ISO_METRIC_FINE = [
+    ThreadSize(f'M{size:g}x{pitch:g}', size * MM, pitch * MM, 'Metric')
+    for size, pitches in [
+        (1, [0.2]), (1.2, [0.2]), (1.4, [0.2]), (1.6, [0.2]), (2, [0.25]), (2.5, [0.35]), (3, [0.35]),
+        (3.5, [0.35]), (4, [0.5]), (5, [0.5]), (6, [0.75]), (8, [1.0, 0.75]), (10, [1.25, 1.0, 0.75]),
+        (12, [1.5, 1.25, 1.0]), (14, [1.5, 1.25, 1.0]), (16, [1.5, 1.0]), (18, [2.0, 1.5, 1.0]),
+        (20, [2.0, 1.5, 1.0]), (22, [2.0, 1.5, 1.0]), (24, [2.0, 1.5, 1.0]), (27, [2.0, 1.5, 1.0]),
+        (30, [3.0, 2.0, 1.5, 1.0]), (33, [3.0, 2.0, 1.5]), (36, [3.0, 2.0, 1.5]), (39, [3.0, 2.0, 1.5]),
+        (42, [4.0, 3.0, 2.0, 1.5]), (45, [4.0, 3.0, 2.0, 1.5]), (48, [4.0, 3.0, 2.0, 1.5]),
+        (52, [4.0, 3.0, 2.0, 1.5]), (56, [4.0, 3.0, 2.0, 1.5]), (60, [4.0, 3.0, 2.0, 1.5]),
+        (64, [4.0, 3.0, 2.0, 1.5]),
+    ]
+    for pitch in pitches
+]
+
+# ASME B1.1 unified coarse (UNC) series, numbered sizes are 0.060 + 0.013 * n inches.
+UNIFIED_COARSE = [
+    ThreadSize(f'{name}-{tpi}', diameter * INCH, INCH / tpi, 'English')
+    for name, diameter, tpi in [
+        ('#1', 0.073, 64), ('#2', 0.086, 56), ('#3', 0.099, 48), ('#4', 0.112, 40), ('#5', 0.125, 40),
+        ('#6', 0.138, 32), ('#8', 0.164, 32), ('#10', 0.190, 24), ('#12', 0.216, 24),
+        ('1/4', 0.25, 20), ('5/16', 0.3125, 18), ('3/8', 0.375, 16), ('7/16', 0.4375, 14),
+        ('1/2', 0.5, 13), ('9/16', 0.5625, 12), ('5/8', 0.625, 11), ('3/4', 0.75, 10),
+        ('7/8', 0.875, 9), ('1', 1.0, 8),
+    ]
+]
+
+# ASME B1.1 unified fine (UNF) series.
+UNIFIED_FINE = [
+    ThreadSize(f'{name}-{tpi}', diameter * INCH, INCH / tpi, 'English')
+    for name, diameter, tpi in [
+        ('#0', 0.060, 80), ('#1', 0.073, 72), ('#2', 0.086, 64), ('#3', 0.099, 56), ('#4', 0.112, 48),
+        ('#5', 0.125, 44), ('#6', 0.138, 40), ('#8', 0.164, 36), ('#10', 0.190, 32), ('#12', 0.216, 28),
+        ('1/4', 0.25, 28), ('5/16', 0.3125, 24), ('3/8', 0.375, 24), ('7/16', 0.4375, 20),
+        ('1/2', 0.5, 20), ('9/16', 0.5625, 18), ('5/8', 0.625, 18), ('3/4', 0.75, 16),
+        ('7/8', 0.875, 14), ('1', 1.0, 12),
+    ]
+]
+
+
+def unified_size_inches(size: str) -> float:
+    """Returns the diameter in inches of a unified size name such as "#10", "1/4", "1" or "1 1/4".
+
+    Raises ValueError if the name is no size.
+    """
+    if size.startswith('#'):
+        return 0.060 + 0.013 * int(size[1:])
+    parts = size.replace('-', ' ').split()
+    if not parts:
+        raise ValueError(f'"{size}" is no unified size.')
+    return float(sum(Fraction(part) for part in parts))
+
+
+def find_thread(sizes, diameter: float, pitch: float = None):
+    """Returns the thread size with the given diameter and pitch, or None if there is none.
+
+    Arguments:
+    sizes -- The thread sizes to search, e.g. ISO_METRIC_COARSE.
+    diameter -- The major diameter in centimeters.
+    pitch -- The pitch in centimeters, None matches any pitch.
+    """
+    for size in sizes:
+        if abs(size.diameter - diameter) < 1e-6 and (pitch is None or abs(size.pitch - pitch) < 1e-6):
+            return size
+    return None
+
+
+def standard_threads(standard: str = 'Metric'):
+    """Returns every coarse and fine thread size of a standard, either 'Metric' or 'English'."""
+    if standard == 'English':
+        return UNIFIED_COARSE + UNIFIED_FINE
+    return ISO_METRIC_COARSE + ISO_METRIC_FINE
+
+
+def thread_sizes(standard: str = 'Metric'):
+    """Returns the thread sizes of a standard, either 'Metric' or 'English'."""
+    return UNIFIED_COARSE if standard == 'English' else ISO_METRIC_COARSE
+
+
+def nearest_thread(diameter: float, standard: str = 'Metric') -> ThreadSize:
+    """Returns the thread size of the standard whose diameter is closest to the given diameter.
+
+    Arguments:
+    diameter -- The major diameter of the thread in centimeters.
+    standard -- The thread standard to pick from, either 'Metric' or 'English'.
+    """
+    return min(thread_sizes(standard), key=lambda size: abs(size.diameter - diameter))
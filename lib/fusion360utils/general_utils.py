@@ -10,12 +10,11 @@
 #  UNINTERRUPTED OR ERROR FREE.
 
 import os
+import time
 import traceback
+from contextlib import contextmanager
 import adsk.core
 
-app = adsk.core.Application.get()
-ui = app.userInterface
-
 # Attempt to read DEBUG flag from parent config.
 try:
     from ... import config
@@ -35,6 +34,9 @@ def log(message: str, level: adsk.core.LogLevels = adsk.core.LogLevels.InfoLogLe
     # Always print to console, only seen through IDE.
     print(message)
 
+    # The application is fetched here rather than at import time to keep add-in startup cheap.
+    app = adsk.core.Application.get()
+
     # Log all errors to Fusion log file.
     if level == adsk.core.LogLevels.ErrorLogLevel:
         log_type = adsk.core.LogTypes.FileLogType
@@ -61,4 +63,20 @@ def handle_error(name: str, show_message_box: bool = False):
 
     # If desired you could show an error as a message box.
     if show_message_box:
-        ui.messageBox(f'{name}\n{traceback.format_exc()}')
+        adsk.core.Application.get().userInterface.messageBox(f'{name}\n{traceback.format_exc()}')
+
+
+@contextmanager
+def timed(name: str, force_console: bool = False):
+    """Context manager that logs how long the wrapped block took to run.
+
+    Arguments:
+    name -- A name used to label the timing in the log.
+    force_console -- Forces the message to be written to the Text Command window.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = (time.perf_counter() - start) * 1000
+        log(f'{name} took {elapsed:.1f} ms', force_console=force_console)
@@ -0,0 +1,22 @@
+import os
+import sys
+
+import pytest
+
+# The bolt geometry has no Fusion imports, so it is tested on its own from the lib folder.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib'))
+
+
+@pytest.fixture
+def printable_bolt(monkeypatch, tmp_path):
+    # The printable_bolt command module imported against the fake Fusion API, journaling to a temporary file.
+    import fake_adsk
+
+    module = fake_adsk.install(monkeypatch)
+    monkeypatch.setattr(module.config, 'JOURNAL_PATH', str(tmp_path / 'builds.jsonl'))
+    yield module
+
+    # Drop the command modules imported against the fake API.
+    package = module.__name__.split('.')[0]
+    for name in [name for name in sys.modules if name.startswith(f'{package}.')]:
+        del sys.modules[name]
@@ -0,0 +1,459 @@
+"""A minimal stand-in for the Fusion 360 API, just enough to run the builds of PrintableBolt outside Fusion.
+
+Temporary bodies remember the cylinders unioned into them, so the faces of an inserted body can be searched for the
+shaft like they are in Fusion. Every sketch, feature and mesh body that is added bumps the timeline count of the
+design. Sketch geometry is only recorded by mocks, since nothing is solved from it.
+"""
+import importlib
+import os
+import sys
+import types
+from unittest import mock
+
+
+class Point3D:
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x, self.y, self.z = x, y, z
+
+    @classmethod
+    def create(cls, x=0.0, y=0.0, z=0.0):
+        return cls(x, y, z)
+
+
+class Vector3D(Point3D):
+    pass
+
+
+class Matrix3D:
+    def __init__(self):
+        self.translation = Vector3D()
+
+    @classmethod
+    def create(cls):
+        return cls()
+
+
+class ValueInput:
+    def __init__(self, realValue=None, stringValue=None):
+        self.realValue = realValue
+        self.stringValue = stringValue
+
+    @classmethod
+    def createByReal(cls, value):
+        return cls(realValue=value)
+
+    @classmethod
+    def createByString(cls, value):
+        return cls(stringValue=value)
+
+
+class ObjectCollection(list):
+    @classmethod
+    def create(cls):
+        return cls()
+
+    def add(self, item):
+        self.append(item)
+
+    @property
+    def count(self):
+        return len(self)
+
+
+class OrientedBoundingBox3D:
+    @classmethod
+    def create(cls, *args):
+        return cls()
+
+
+class Cylinder:
+    def __init__(self, radius):
+        self.radius = radius
+
+
+class BoundingBox3D:
+    def __init__(self, minPoint):
+        self.minPoint = minPoint
+
+
+class Face:
+    def __init__(self, geometry, minZ):
+        self.geometry = geometry
+        self.boundingBox = BoundingBox3D(Point3D(0, 0, minZ))
+
+
+class BooleanTypes:
+    DifferenceBooleanType = 0
+    IntersectionBooleanType = 1
+    UnionBooleanType = 2
+
+
+class DesignTypes:
+    DirectDesignType = 0
+    ParametricDesignType = 1
+
+
+class FeatureOperations:
+    JoinFeatureOperation = 0
+    CutFeatureOperation = 1
+    IntersectFeatureOperation = 2
+    NewBodyFeatureOperation = 3
+    NewComponentFeatureOperation = 4
+
+
+class TemporaryBody:
+    def __init__(self, cylinders):
+        # (radius, lowest z) of every cylinder unioned into the body.
+        self.cylinders = cylinders
+
+
+class TemporaryBRepManager:
+    instance = None
+
+    def __init__(self):
+        self.operations = []
+
+    @classmethod
+    def get(cls):
+        if cls.instance is None:
+            cls.instance = cls()
+        return cls.instance
+
+    def createCylinderOrCone(self, pointOne, pointOneRadius, pointTwo, pointTwoRadius):
+        self.operations.append('cylinder')
+        return TemporaryBody([(pointOneRadius, min(pointOne.z, pointTwo.z))])
+
+    def createBox(self, box):
+        self.operations.append('box')
+        return TemporaryBody([])
+
+    def booleanOperation(self, targetBody, toolBody, booleanType):
+        self.operations.append(('boolean', booleanType))
+        if booleanType == BooleanTypes.UnionBooleanType:
+            targetBody.cylinders.extend(toolBody.cylinders)
+        return True
+
+
+class Body:
+    def __init__(self, temporaryBody):
+        self.name = ''
+        self.faces = [Face(Cylinder(radius), minZ) for radius, minZ in temporaryBody.cylinders]
+
+
+class Timeline:
+    def __init__(self):
+        self.count = 0
+
+
+class Collection(list):
+    def __init__(self, design):
+        super().__init__()
+        self.design = design
+
+    @property
+    def count(self):
+        return len(self)
+
+    def item(self, index):
+        return self[index]
+
+    def addFeature(self, feature):
+        self.append(feature)
+        self.design.timeline.count += 1
+        return feature
+
+
+class BaseFeature:
+    def __init__(self):
+        self.bodies = []
+        self.isEditing = False
+
+    def startEdit(self):
+        self.isEditing = True
+
+    def finishEdit(self):
+        self.isEditing = False
+
+
+class BaseFeatures(Collection):
+    def add(self):
+        return self.addFeature(BaseFeature())
+
+
+class BRepBodies(Collection):
+    def add(self, body, baseFeature=None):
+        bRepBody = Body(body)
+        self.append(bRepBody)
+        if baseFeature is not None:
+            assert baseFeature.isEditing
+            baseFeature.bodies.append(bRepBody)
+        return bRepBody
+
+
+class ThreadDataQuery:
+    defaultMetricThreadType = 'ISO Metric profile'
+    allThreadTypes = ['ISO Metric profile', 'ANSI Unified Screw Threads']
+
+    # The diameter in cm and designations of the sizes of each thread type, the first designation being the
+    # recommended one, and the classes of the thread type.
+    sizes = {
+        'ISO Metric profile': {'5': (0.5, ['M5x0.8', 'M5x0.5', 'M5x0.35']), '6': (0.6, ['M6x1', 'M6x0.75', 'M6x0.5'])},
+        'ANSI Unified Screw Threads': {'1/4': (0.635, ['1/4-20 UNC', '1/4-28 UNF'])},
+    }
+    classes = {'ISO Metric profile': ['6g', '4g6g'], 'ANSI Unified Screw Threads': ['2A', '3A']}
+
+    def recommendThreadData(self, modelDiameter, isInternal, threadType):
+        diameter, designations = min(self.sizes[threadType].values(), key=lambda size: abs(size[0] - modelDiameter))
+        return True, designations[0], self.classes[threadType][0]
+
+    def allSizes(self, threadType):
+        return list(self.sizes[threadType])
+
+    def allDesignations(self, threadType, size):
+        return self.sizes[threadType][size][1]
+
+    def allClasses(self, isInternal, threadType, designation):
+        return self.classes[threadType]
+
+
+class ThreadFeatures(Collection):
+    def __init__(self, design):
+        super().__init__(design)
+        self.threadDataQuery = ThreadDataQuery()
+
+    def createThreadInfo(self, isInternal, threadType, designation, threadClass):
+        return (threadType, designation, threadClass)
+
+    def createInput(self, faces, threadInfo):
+        return types.SimpleNamespace(faces=faces, threadInfo=threadInfo, isModeled=False)
+
+    def add(self, threadInput):
+        return self.addFeature(types.SimpleNamespace(faces=list(threadInput.faces), threadInfo=threadInput.threadInfo))
+
+
+class OffsetFeatures(Collection):
+    def createInput(self, faces, distance, operation, isChainSelection):
+        return types.SimpleNamespace(faces=faces, distance=distance, operation=operation)
+
+    def add(self, offsetInput):
+        return self.addFeature(offsetInput)
+
+
+class Profile:
+    def __init__(self, loopCount):
+        self.profileLoops = ObjectCollection([None] * loopCount)
+
+
+class Sketch:
+    def __init__(self):
+        self.originPoint = Point3D()
+        # A head outline and the same outline with a socket or flange loop.
+        self.profiles = [Profile(1), Profile(2)]
+        self.sketchCurves = mock.MagicMock()
+        self.sketchPoints = mock.MagicMock()
+        self.sketchDimensions = mock.MagicMock()
+        self.geometricConstraints = mock.MagicMock()
+
+
+class Sketches(Collection):
+    def add(self, plane):
+        return self.addFeature(Sketch())
+
+
+class ExtrudeFeatures(Collection):
+    def createInput(self, profile, operation):
+        return mock.MagicMock(profile=profile, operation=operation)
+
+    def add(self, extrudeInput):
+        return self.addFeature(types.SimpleNamespace(faces=[mock.MagicMock(), mock.MagicMock()], sideFaces=[mock.MagicMock()]))
+
+
+class MeshBodies(Collection):
+    def addByTriangleMeshData(self, coordinates, indices, normalVectors, normalIndices):
+        return self.addFeature(types.SimpleNamespace(name='', triangleCount=len(indices) // 3))
+
+
+class Attributes(dict):
+    def add(self, groupName, name, value):
+        self[(groupName, name)] = types.SimpleNamespace(value=value)
+
+    def itemByName(self, groupName, name):
+        return self.get((groupName, name))
+
+
+class Component:
+    def __init__(self, design):
+        self.features = types.SimpleNamespace(
+            baseFeatures=BaseFeatures(design),
+            threadFeatures=ThreadFeatures(design),
+            offsetFeatures=OffsetFeatures(design),
+            extrudeFeatures=ExtrudeFeatures(design),
+        )
+        self.bRepBodies = BRepBodies(design)
+        self.meshBodies = MeshBodies(design)
+        self.sketches = Sketches(design)
+        self.xYConstructionPlane = self.xZConstructionPlane = mock.MagicMock()
+        self.attributes = Attributes()
+
+
+class Occurrences:
+    def __init__(self, design):
+        self.design = design
+        self.components = []
+
+    def addNewComponent(self, transform):
+        self.components.append(Component(self.design))
+        return types.SimpleNamespace(component=self.components[-1], transform=transform)
+
+    def addExistingComponent(self, component, transform):
+        return types.SimpleNamespace(component=component, transform=transform)
+
+
+class UserParameter:
+    def __init__(self, name, value):
+        self.name = name
+        self._value = value
+        self.writes = 0
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        self.writes += 1
+
+
+class UserParameters(dict):
+    def add(self, name, value, units, comment):
+        assert name not in self, f'A user parameter named {name} already exists'
+        self[name] = UserParameter(name, value.realValue)
+        return self[name]
+
+    def itemByName(self, name):
+        return self.get(name)
+
+
+class Design:
+    def __init__(self, designType=DesignTypes.ParametricDesignType):
+        self.designType = designType
+        self.timeline = Timeline()
+        self.userParameters = UserParameters()
+        self.unitsManager = types.SimpleNamespace(defaultLengthUnits='mm')
+        self.rootComponent = types.SimpleNamespace(occurrences=Occurrences(self))
+
+    @staticmethod
+    def cast(product):
+        return product
+
+
+class CustomEventHandler:
+    pass
+
+
+class CustomEvent:
+    def __init__(self):
+        self.handlers = []
+
+    def add(self, handler: 'CustomEventHandler'):
+        self.handlers.append(handler)
+
+
+class ProgressDialog:
+    def __init__(self):
+        self.isCancelButtonShown = False
+        self.isShowing = False
+        self.wasCancelled = False
+        self.message = ''
+        self.maximumValue = 0
+        self.progressValue = 0
+
+    def show(self, title, message, minimumValue, maximumValue, delay):
+        self.isShowing = True
+        self.message = message
+        self.maximumValue = maximumValue
+
+    def hide(self):
+        self.isShowing = False
+
+
+class UserInterface:
+    def __init__(self):
+        self.progressDialogs = []
+        self.messageBox = mock.MagicMock()
+
+    def createProgressDialog(self):
+        self.progressDialogs.append(ProgressDialog())
+        return self.progressDialogs[-1]
+
+
+class Application:
+    """Custom events fired from any thread are only delivered when the test calls deliver, like Fusion only
+    delivers them from its main loop."""
+
+    def __init__(self, design):
+        self.activeProduct = design
+        self.customEvents = {}
+        self.fired = []
+
+    def registerCustomEvent(self, eventId):
+        assert eventId not in self.customEvents, f'{eventId} is already registered'
+        self.customEvents[eventId] = CustomEvent()
+        return self.customEvents[eventId]
+
+    def unregisterCustomEvent(self, eventId):
+        self.customEvents.pop(eventId, None)
+        return True
+
+    def fireCustomEvent(self, eventId, additionalInfo=''):
+        self.fired.append(eventId)
+        return True
+
+    def deliver(self):
+        # Delivers the events fired so far, returns how many were delivered.
+        fired, self.fired = self.fired, []
+        for eventId in fired:
+            event = self.customEvents.get(eventId)
+            for handler in list(event.handlers) if event is not None else []:
+                handler.notify(types.SimpleNamespace(firingEvent=event, additionalInfo=''))
+        return len(fired)
+
+
+def fallback(name):
+    # Anything the build doesn't use only needs to exist, e.g. for annotations and default arguments.
+    return mock.MagicMock(name=name)
+
+
+def install(monkeypatch):
+    """Puts the fake adsk modules in sys.modules and returns the printable_bolt module imported against them.
+
+    Arguments:
+    monkeypatch -- The pytest monkeypatch fixture, which restores sys.modules after the test.
+    """
+    core = types.ModuleType('adsk.core')
+    for item in [Point3D, Vector3D, Matrix3D, ValueInput, ObjectCollection, OrientedBoundingBox3D, Cylinder]:
+        setattr(core, item.__name__, item)
+    core.__getattr__ = fallback
+
+    fusion = types.ModuleType('adsk.fusion')
+    for item in [BooleanTypes, DesignTypes, FeatureOperations, TemporaryBRepManager, Design]:
+        setattr(fusion, item.__name__, item)
+    fusion.__getattr__ = fallback
+
+    adsk = types.ModuleType('adsk')
+    adsk.core, adsk.fusion = core, fusion
+
+    TemporaryBRepManager.instance = None
+    monkeypatch.setitem(sys.modules, 'adsk', adsk)
+    monkeypatch.setitem(sys.modules, 'adsk.core', core)
+    monkeypatch.setitem(sys.modules, 'adsk.fusion', fusion)
+
+    # The add-in folder is the top level package of the command modules.
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    monkeypatch.syspath_prepend(os.path.dirname(root))
+    package = os.path.basename(root)
+    for name in [name for name in sys.modules if name == package or name.startswith(f'{package}.')]:
+        monkeypatch.delitem(sys.modules, name)
+
+    return importlib.import_module(f'{package}.commands.printableBoltCreate.printable_bolt')
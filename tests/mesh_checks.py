@@ -0,0 +1,38 @@
+import math
+from collections import Counter
+
+
+def triangles(mesh):
+    coordinates = mesh.coordinates
+    for t in range(0, len(mesh.indices), 3):
+        yield tuple(tuple(coordinates[3 * i:3 * i + 3]) for i in mesh.indices[t:t + 3])
+
+
+def volume(mesh):
+    """Signed volume enclosed by a mesh, positive when its triangles face outwards."""
+    total = 0.0
+    for (ax, ay, az), (bx, by, bz), (cx, cy, cz) in triangles(mesh):
+        total += ax * (by * cz - bz * cy) - ay * (bx * cz - bz * cx) + az * (bx * cy - by * cx)
+    return total / 6
+
+
+def open_edges(mesh):
+    """Directed edges that are not matched by exactly one opposite edge, empty for a closed oriented mesh."""
+    edges = Counter()
+    for t in range(0, len(mesh.indices), 3):
+        a, b, c = mesh.indices[t:t + 3]
+        edges.update(((a, b), (b, c), (c, a)))
+    return [edge for edge, count in edges.items() if count != 1 or edges[(edge[1], edge[0])] != 1]
+
+
+def degenerate_triangles(mesh):
+    return [t for t in range(0, len(mesh.indices), 3) if len(set(mesh.indices[t:t + 3])) != 3]
+
+
+def radii(mesh):
+    coordinates = mesh.coordinates
+    return [math.hypot(coordinates[i], coordinates[i + 1]) for i in range(0, len(coordinates), 3)]
+
+
+def heights(mesh):
+    return mesh.coordinates[2::3]
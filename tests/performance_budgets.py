@@ -0,0 +1,26 @@
+import json
+import os
+
+from boltgeometry import mesh, thread_table
+
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'budgets.json')) as budgetsFile:
+    BUDGETS = {name: budget for name, budget in json.load(budgetsFile).items() if not name.startswith('_')}
+
+ALL_SIZES = thread_table.ISO_METRIC_COARSE + thread_table.UNIFIED_COARSE
+
+
+def spec_class(size):
+    for name, budget in sorted(BUDGETS.items(), key=lambda item: item[1]['max_diameter']):
+        if size.diameter <= budget['max_diameter'] + 1e-9:
+            return name
+    raise ValueError(f'No budget covers {size.designation}')
+
+
+def build(size):
+    """Builds the combined preview mesh of the spec a budget applies to."""
+    return mesh.bolt(1.8 * size.diameter, 0.7 * size.diameter, 6, size.diameter, 3 * size.diameter,
+                     size.pitch, 0.01 * size.diameter).combined()
+
+
+def largest_size(name):
+    return max((size for size in ALL_SIZES if spec_class(size) == name), key=lambda size: size.diameter)
@@ -0,0 +1,131 @@
+import importlib
+import json
+
+import pytest
+
+import fake_adsk
+
+
+@pytest.fixture
+def batch(printable_bolt):
+    package = printable_bolt.__name__.split('.')[0]
+    return importlib.import_module(f'{package}.commands.printableBoltBatch.batch')
+
+
+def bolt_spec(index, **changes):
+    spec = {'boltName': f'Bolt {index}', 'bodyDiameter': 0.5, 'headDiameter': 0.9, 'bodyLength': 1.0 + index / 10}
+    spec.update(changes)
+    return spec
+
+
+def start_job(batch, tmp_path, specs):
+    path = tmp_path / 'specs.json'
+    path.write_text(json.dumps(specs), encoding='utf-8')
+    design = fake_adsk.Design()
+    job = batch.BatchJob(fake_adsk.UserInterface(), fake_adsk.Application(design), str(path), 'direct')
+
+    job.run()
+    job.worker.join()
+    return job, design
+
+
+def deliver_all(job):
+    # Delivers custom events like Fusion's main loop would until the handler stops firing them.
+    for _ in range(100):
+        if not job.app.deliver():
+            return
+    raise AssertionError('The batch kept firing custom events')
+
+
+def test_batch_builds_each_spec_once_and_places_the_repeats(batch, tmp_path):
+    specs = [bolt_spec(index) for index in range(6)] + [bolt_spec(0), bolt_spec(1, boltName='renamed')]
+    job, design = start_job(batch, tmp_path, specs)
+    assert batch.activeJob is job
+
+    deliver_all(job)
+
+    assert (job.built, job.placed, job.failed, job.total, job.instances) == (6, 2, 0, 6, 8)
+    assert len(design.rootComponent.occurrences.components) == 6
+    assert job.finished and batch.activeJob is None
+    assert not job.progressDialog.isShowing
+    assert batch.CUSTOM_EVENT_ID not in job.app.customEvents
+    job.ui.messageBox.assert_called_once_with(job.summary, 'Printable Bolt Batch')
+
+
+def test_batch_builds_a_chunk_per_event(batch, tmp_path):
+    job, design = start_job(batch, tmp_path, [bolt_spec(index) for index in range(batch.CHUNK_SIZE + 2)])
+
+    job.onResults(None)
+
+    assert len(design.rootComponent.occurrences.components) == batch.CHUNK_SIZE
+    assert job.progressDialog.progressValue == batch.CHUNK_SIZE
+    assert not job.finished
+    # The handler hands control back to Fusion and asks to be called again for the rest.
+    assert job.app.fired[-1] == batch.CUSTOM_EVENT_ID
+
+
+def test_a_bolt_that_raises_counts_as_failed(batch, printable_bolt, tmp_path, monkeypatch):
+    applySpec = printable_bolt.PrintableBolt.applySpec
+
+    def failingApplySpec(self, spec):
+        if spec['boltName'] == 'Bolt 1':
+            raise RuntimeError('broken spec')
+        applySpec(self, spec)
+
+    monkeypatch.setattr(printable_bolt.PrintableBolt, 'applySpec', failingApplySpec)
+    job, design = start_job(batch, tmp_path, [bolt_spec(index) for index in range(3)])
+
+    deliver_all(job)
+
+    assert (job.built, job.failed) == (2, 1)
+    assert job.finished and batch.activeJob is None
+
+
+def test_an_error_outside_a_bolt_ends_the_job(batch, tmp_path, monkeypatch):
+    job, design = start_job(batch, tmp_path, [bolt_spec(index) for index in range(3)])
+
+    def broken():
+        raise RuntimeError('broken queue')
+
+    monkeypatch.setattr(job.results, 'get_nowait', broken)
+
+    deliver_all(job)
+
+    assert job.finished and batch.activeJob is None
+    assert not job.progressDialog.isShowing
+    assert 'stopped unexpectedly' in job.ui.messageBox.call_args[0][0]
+
+
+def test_cancelling_keeps_the_built_bolts_and_stops(batch, tmp_path):
+    job, design = start_job(batch, tmp_path, [bolt_spec(index) for index in range(batch.CHUNK_SIZE * 2)])
+    job.onResults(None)
+
+    job.progressDialog.wasCancelled = True
+    deliver_all(job)
+
+    assert job.built == batch.CHUNK_SIZE
+    assert len(design.rootComponent.occurrences.components) == batch.CHUNK_SIZE
+    assert job.finished and job.cancelled.is_set() and batch.activeJob is None
+    assert batch.CUSTOM_EVENT_ID not in job.app.customEvents
+
+    # Events still queued by Fusion after the cancel are ignored.
+    job.onResults(None)
+    assert job.built == batch.CHUNK_SIZE
+
+
+def test_worker_only_meshes_threads_fusion_cant_model(batch, tmp_path):
+    specs = [
+        bolt_spec(0),
+        bolt_spec(1, bodyDiameter=1.0, headDiameter=1.8, pitch=0.125),
+        bolt_spec(2, pitch=0.05, threadStarts=2),
+        bolt_spec(3, bodyDiameter=0.635, headDiameter=1.1, threadStandard='English', threadAngle=55.0),
+        bolt_spec(4, pitch=0.07),
+    ]
+    path = tmp_path / 'specs.json'
+    path.write_text(json.dumps(specs), encoding='utf-8')
+    job = batch.BatchJob(fake_adsk.UserInterface(), fake_adsk.Application(fake_adsk.Design()), str(path), 'direct')
+
+    job.compute()
+
+    items = [payload for kind, payload in iter(job.results.get_nowait, ('done', None)) if kind == 'item']
+    assert [item.threadRidges is not None for item in items] == [False, False, True, True, True]
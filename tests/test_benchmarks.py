@@ -0,0 +1,17 @@
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from performance_budgets import BUDGETS, build, largest_size
+
+
+@pytest.mark.parametrize('name', sorted(BUDGETS))
+def test_benchmark_spec_class(benchmark, name):
+    # Benchmarks the largest size of each class against its latency budget.
+    size = largest_size(name)
+    benchmark.extra_info['designation'] = size.designation
+
+    bolt = benchmark(build, size)
+
+    assert bolt.triangle_count <= BUDGETS[name]['triangles']
+    assert benchmark.stats.stats.mean * 1000 <= BUDGETS[name]['latency_ms']
@@ -0,0 +1,100 @@
+import zipfile
+
+import pytest
+
+from boltgeometry import bom, thread_table
+from boltgeometry.spec import spec_hash
+
+MM = thread_table.MM
+INCH = thread_table.INCH
+
+
+@pytest.mark.parametrize('text, designation, diameter, pitch, length', [
+    ('M5x20', 'M5', 5 * MM, None, 20 * MM),
+    ('M5 x 20 mm', 'M5', 5 * MM, None, 20 * MM),
+    ('Hex bolt M8X35 DIN 933 A2', 'M8', 8 * MM, None, 35 * MM),
+    ('M10x1.25x40', 'M10x1.25', 10 * MM, 1.25 * MM, 40 * MM),
+    ('M10x1.5x40', 'M10', 10 * MM, None, 40 * MM),
+    ('M7x20 replaced by M3x50', 'M3', 3 * MM, None, 50 * MM),
+    ('1/4-20 x 1"', '1/4-20', 0.25 * INCH, None, 1 * INCH),
+    ('#10-24 x 3/4', '#10-24', 0.19 * INCH, None, 0.75 * INCH),
+    ('10-24 x 3/4', '#10-24', 0.19 * INCH, None, 0.75 * INCH),
+    ('8-32 x 1/2 SHCS', '#8-32', 0.164 * INCH, None, 0.5 * INCH),
+    ('10-32 x 1/2', '#10-32', 0.19 * INCH, INCH / 32, 0.5 * INCH),
+    ('1-8 x 3', '1-8', 1 * INCH, None, 3 * INCH),
+    ('1/4"-28 UNF x 1-1/2"', '1/4-28', 0.25 * INCH, INCH / 28, 1.5 * INCH),
+    ('1/2-13 UNC-2A x 2', '1/2-13', 0.5 * INCH, None, 2 * INCH),
+    ('#6-40 UNF 3A x 3/8', '#6-40', 0.138 * INCH, INCH / 40, 0.375 * INCH),
+    ('M8x1x25', 'M8x1', 8 * MM, 1 * MM, 25 * MM),
+    ('5/16-18 x 1.25 in', '5/16-18', 0.3125 * INCH, None, 1.25 * INCH),
+])
+def test_parse_size(text, designation, diameter, pitch, length):
+    size = bom.parse_size(text)
+
+    assert size.designation == designation
+    assert size.diameter == pytest.approx(diameter)
+    assert size.pitch == pytest.approx(pitch) if pitch is not None else size.pitch is None
+    assert size.length == pytest.approx(length)
+
+
+@pytest.mark.parametrize('text', [
+    'Flat washer 5mm', 'Nyloc nut M5', '', 'Rev 2-3 x 4 bracket', 'M7x20', '1/4-19 x 1',
+    'Hex nut M6x1.0', 'Nut M10x1.25', 'M5x20x30',
+])
+def test_parse_size_ignores_other_parts(text):
+    assert bom.parse_size(text) is None
+
+
+@pytest.mark.parametrize('text, quantity', [('4', 4), ('2 pcs', 2), (' 3.0', 3), ('1,000', 1000), ('', 1), ('ea', 1)])
+def test_parse_quantity(text, quantity):
+    assert bom.parse_quantity(text) == quantity
+
+
+def test_csv_bom_dedupes_sizes_across_part_numbers(tmp_path):
+    path = tmp_path / 'bom.csv'
+    path.write_text(
+        'Part Number;Description;Qty\n'
+        'ACME-100;Hex bolt M5x20;4\n'
+        'ACME-200;M5 x 20 mm stainless;2 pcs\n'
+        'ACME-300;Washer M5;10\n'
+        'ACME-310;Hex nut M6x1.0;8\n'
+        '\n'
+        'ACME-400;1/4-20 x 1";\n',
+        encoding='utf-8')
+
+    specs, skipped = bom.bom_specs(str(path), backlash=0.01)
+
+    assert [(spec.spec['boltName'], spec.quantity) for spec in specs] == [('M5', 6), ('1/4-20', 1)]
+    assert [line.part_number for line in specs[0].lines] == ['ACME-100', 'ACME-200']
+    assert skipped == ['Washer M5', 'Hex nut M6x1.0']
+    assert all(spec.spec['backlash'] == 0.01 for spec in specs)
+
+
+def test_unique_specs_keys_on_the_geometry():
+    short = bom.size_spec(bom.parse_size('M5x20'))
+    entries = [(short, 1, 'a'), (dict(short, boltName='other name'), 3, 'b'), (bom.size_spec(bom.parse_size('M5x25')), 1, 'c')]
+
+    specs = bom.unique_specs(entries)
+
+    assert [(spec.quantity, spec.lines) for spec in specs] == [(4, ['a', 'b']), (1, ['c'])]
+    assert specs[0].spec_hash == spec_hash(short)
+
+
+def test_xlsx_bom(tmp_path):
+    path = tmp_path / 'bom.xlsx'
+    main = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+    with zipfile.ZipFile(path, 'w') as workbook:
+        workbook.writestr('xl/sharedStrings.xml',
+                          f'<sst xmlns="{main}"><si><t>Item</t></si><si><t>Quantity</t></si>'
+                          f'<si><r><t>M3</t></r><r><t>x12</t></r></si></sst>')
+        workbook.writestr('xl/worksheets/sheet1.xml',
+                          f'<worksheet xmlns="{main}"><sheetData>'
+                          f'<row r="1"><c r="A1" t="s"><v>0</v></c><c r="C1" t="s"><v>1</v></c></row>'
+                          f'<row r="2"><c r="A2" t="s"><v>2</v></c><c r="C2"><v>8</v></c></row>'
+                          f'<row r="3"><c r="A3" t="inlineStr"><is><t>#8-32 x 1/2</t></is></c></row>'
+                          f'</sheetData></worksheet>')
+
+    lines, skipped = bom.parse_bom(bom.read_rows(str(path)))
+
+    assert [(line.size.designation, line.quantity) for line in lines] == [('M3', 8), ('#8-32', 1)]
+    assert skipped == []
@@ -0,0 +1,24 @@
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+import fake_adsk
+
+
+@pytest.mark.parametrize('build_mode', ['direct', 'parametric'])
+def test_benchmark_build_mode(benchmark, printable_bolt, build_mode):
+    # Benchmarks the Python side of buildBolt in each mode against the fake API, the time Fusion spends
+    # on the features isn't included, so the timeline count is recorded next to it.
+    def build():
+        design = fake_adsk.Design()
+        bolt = printable_bolt.PrintableBolt(fake_adsk.mock.MagicMock(), fake_adsk.mock.MagicMock(activeProduct=design))
+        bolt.buildMode = build_mode
+        bolt.bodyDiameter = 0.5
+        bolt.headDiameter = 0.9
+        bolt.buildBolt()
+        return design
+
+    design = benchmark(build)
+
+    benchmark.extra_info['features'] = design.timeline.count
+    assert design.timeline.count == {'direct': 3, 'parametric': 6}[build_mode]
@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+import fake_adsk
+from boltgeometry import bom
+
+
+def direct_bolt(printable_bolt, design):
+    app = fake_adsk.mock.MagicMock(activeProduct=design)
+    ui = fake_adsk.mock.MagicMock()
+    bolt = printable_bolt.PrintableBolt(ui, app)
+    bolt.buildMode = printable_bolt.BUILD_MODE_DIRECT
+    bolt.bodyDiameter = 0.5
+    bolt.headDiameter = 0.9
+    return bolt
+
+
+@pytest.mark.parametrize('head_profile', ['Polygon', 'Socket Cap', 'Thumbscrew', 'Flanged'])
+def test_direct_body_is_one_base_feature(printable_bolt, head_profile):
+    design = fake_adsk.Design()
+    bolt = direct_bolt(printable_bolt, design)
+    bolt.headProfile = head_profile
+    component = fake_adsk.Component(design)
+
+    shaft = bolt.buildDirectBody(component, 0.5)
+
+    assert design.timeline.count == 1
+    assert len(component.features.baseFeatures[0].bodies) == 1
+    assert shaft.geometry.radius == pytest.approx(0.25)
+    assert shaft.boundingBox.minPoint.z < 0
+
+
+def test_direct_body_in_a_direct_design_has_no_feature(printable_bolt):
+    design = fake_adsk.Design(fake_adsk.DesignTypes.DirectDesignType)
+    component = fake_adsk.Component(design)
+
+    shaft = direct_bolt(printable_bolt, design).buildDirectBody(component, 0.5)
+
+    assert design.timeline.count == 0
+    assert component.bRepBodies.count == 1
+    assert shaft is not None
+
+
+def test_direct_build_adds_the_base_thread_and_offset_features(printable_bolt, tmp_path):
+    design = fake_adsk.Design()
+    bolt = direct_bolt(printable_bolt, design)
+
+    component = bolt.buildBolt()
+
+    record = json.loads((tmp_path / 'builds.jsonl').read_text().splitlines()[-1])
+    assert record['outcome'] == 'success'
+    assert record['features'] == 3
+    assert component.features.threadFeatures[0].threadInfo[1] == 'M5x0.8'
+    bolt.ui.messageBox.assert_not_called()
+
+
+def test_thread_deeper_than_the_shaft_is_rejected(printable_bolt):
+    bolt = direct_bolt(printable_bolt, fake_adsk.Design())
+    bolt.bodyDiameter = 0.3
+    bolt.pitch = 0.5
+
+    with pytest.raises(ValueError):
+        bolt.customThreadRootDiameter()
+
+
+@pytest.mark.parametrize('text, designation', [('1/4-20 x 1', '1/4-20 UNC'), ('1/4-28 x 1', '1/4-28 UNF')])
+def test_unified_bom_sizes_are_modeled_with_the_inch_thread_type(printable_bolt, text, designation):
+    design = fake_adsk.Design()
+    bolt = direct_bolt(printable_bolt, design)
+    bolt.applySpec(bom.size_spec(bom.parse_size(text)))
+
+    component = bolt.buildBolt()
+
+    threadInfo = component.features.threadFeatures[0].threadInfo
+    assert threadInfo == ('ANSI Unified Screw Threads', designation, '2A')
+    assert component.bRepBodies.count == 1
+
+
+@pytest.mark.parametrize('build_mode, features', [('direct', 3), ('parametric', 6)])
+def test_build_mode_timeline_counts(printable_bolt, tmp_path, build_mode, features):
+    # The direct body replaces two sketches and two extrudes with one base feature.
+    bolt = direct_bolt(printable_bolt, fake_adsk.Design())
+    bolt.buildMode = build_mode
+
+    bolt.buildBolt()
+
+    record = json.loads((tmp_path / 'builds.jsonl').read_text().splitlines()[-1])
+    assert record['outcome'] == 'success'
+    assert record['features'] == features
+
+
+def test_thread_report_estimates_then_reports_the_journaled_time(printable_bolt):
+    bolt = direct_bolt(printable_bolt, fake_adsk.Design())
+    bolt.threadStarts = 2
+
+    assert ' mesh triangles, about ' in bolt.threadReport()
+    assert bolt.threadReport().endswith(' ms to generate')
+
+    bolt.buildBolt()
+
+    assert ', last built in ' in bolt.threadReport()
+    assert 'ms to generate' not in bolt.threadReport()
@@ -0,0 +1,52 @@
+import math
+
+import pytest
+
+from boltgeometry import head_profiles, mesh
+from mesh_checks import open_edges, radii, volume
+
+PROFILES = list(head_profiles.HEAD_PROFILES.values())
+
+
+@pytest.mark.parametrize('profile', PROFILES, ids=lambda profile: profile.name)
+def test_head_is_closed_and_within_its_diameter(profile):
+    head = mesh.head(profile.name, 2.0, 0.8, 6)
+    outline_radii = radii(head)
+
+    assert open_edges(head) == []
+    assert volume(head) > 0
+    bound = max(1.0, profile.flange_ratio)
+    assert max(outline_radii) <= bound + 1e-9
+
+
+def test_socket_cap_volume_excludes_the_socket():
+    profile = head_profiles.HEAD_PROFILES['Socket Cap']
+    head = mesh.head(profile.name, 2.0, 1.0)
+
+    outer = profile.sides / 2 * math.sin(2 * math.pi / profile.sides)
+    socket_radius = profile.socket_ratio
+    socket = 3 * math.sqrt(3) / 2 * socket_radius ** 2
+
+    assert volume(head) == pytest.approx(outer - socket)
+
+
+def test_notched_outline_stays_star_shaped():
+    for name in ('Round Knurled', 'Thumbscrew'):
+        profile = head_profiles.HEAD_PROFILES[name]
+        outline = head_profiles.unit_outline(name, 0)
+
+        assert len(outline) == profile.sides
+        assert all(1 - profile.notch_ratio - 1e-9 <= math.hypot(x, y) <= 1 + 1e-9 for x, y in outline)
+
+
+def test_vertex_tables_are_cached():
+    assert head_profiles.unit_circle(6) is head_profiles.unit_circle(6)
+    assert head_profiles.unit_outline('Round Knurled', 0) is head_profiles.unit_outline('Round Knurled', 0)
+
+
+@pytest.mark.parametrize('sides', range(3, 13))
+def test_polygon_radii_hit_the_corners(sides):
+    radii_table = head_profiles.unit_polygon_radii(sides, sides * 4)
+
+    assert radii_table[::4] == pytest.approx([1.0] * sides)
+    assert min(radii_table) == pytest.approx(math.cos(math.pi / sides))
@@ -0,0 +1,104 @@
+import importlib.util
+import os
+
+import pytest
+
+# The journal has no Fusion imports but lives in a command package that does, so it is loaded from its file.
+JOURNAL_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            'commands', 'printableBoltCreate', 'journal.py')
+journal_spec = importlib.util.spec_from_file_location('journal', JOURNAL_FILE)
+journal = importlib.util.module_from_spec(journal_spec)
+journal_spec.loader.exec_module(journal)
+
+
+def record(index, event='execute', duration=0.1, error=None, stages=None):
+    return {
+        'index': index,
+        'event': event,
+        'specHash': f'hash{index}',
+        'spec': {'index': index},
+        'stages': stages or {},
+        'outcome': 'error' if error else 'success',
+        'error': error,
+        'duration': duration,
+    }
+
+
+def indices(path, backups=0):
+    return [item['index'] for item in journal.read(str(path), backups)]
+
+
+@pytest.mark.parametrize('backups, files', [
+    (0, {'builds.jsonl': [4]}),
+    (1, {'builds.jsonl': [4], 'builds.jsonl.1': [3]}),
+    (3, {'builds.jsonl': [4], 'builds.jsonl.1': [3], 'builds.jsonl.2': [2], 'builds.jsonl.3': [1]}),
+])
+def test_append_rotates_once_the_journal_reaches_max_bytes(tmp_path, backups, files):
+    path = tmp_path / 'builds.jsonl'
+
+    # Every record is larger than maxBytes, so each append after the first rotates.
+    for index in range(5):
+        journal.append(str(path), record(index), 10, backups)
+
+    assert {name: indices(tmp_path / name) for name in sorted(os.listdir(tmp_path))} == files
+    assert indices(path, backups) == sorted(sum(files.values(), []))
+
+
+def test_append_keeps_writing_below_max_bytes(tmp_path):
+    path = tmp_path / 'journal' / 'builds.jsonl'
+
+    for index in range(3):
+        journal.append(str(path), record(index), 1 << 20, 3)
+
+    assert indices(path, 3) == [0, 1, 2]
+    assert os.listdir(path.parent) == ['builds.jsonl']
+
+
+def test_read_skips_truncated_and_blank_lines(tmp_path):
+    path = tmp_path / 'builds.jsonl'
+    journal.append(str(path), record(0), 1 << 20, 0)
+    with open(path, 'a', encoding='utf-8') as journal_file:
+        journal_file.write('\n{"index": 1, "event": "exec')
+    journal.append(str(path), record(2), 1 << 20, 0)
+
+    assert indices(path) == [0, 2]
+
+
+def test_read_without_a_journal_yields_nothing(tmp_path):
+    assert indices(tmp_path / 'missing.jsonl', 3) == []
+
+
+@pytest.mark.parametrize('fraction, expected', [(0.0, 1), (0.1, 1), (0.5, 5), (0.51, 6), (0.9, 9), (0.99, 10), (1.0, 10)])
+def test_percentile_is_nearest_rank(fraction, expected):
+    assert journal.percentile([7, 3, 10, 1, 5, 2, 9, 4, 8, 6], fraction) == expected
+
+
+def test_percentile_of_nothing_is_none():
+    assert journal.percentile([], 0.5) is None
+
+
+def test_summary_lists_failures_and_the_slowest_specs():
+    records = [
+        record(0, duration=0.010, stages={'body': 0.004}),
+        record(1, duration=0.030, stages={'body': 0.020}),
+        record(2, duration=0.020, error='RuntimeError'),
+        record(3, event='preview', duration=None, error='ValueError'),
+        record(4, event='preview', duration=0.005),
+        dict(record(1, duration=0.050), index=5),
+    ]
+
+    summary = journal.summarize(records, slowest=2).splitlines()
+
+    assert summary[0] == '6 builds'
+    assert 'execute: 4 builds, 1 failed' in summary
+    assert 'preview: 2 builds, 1 failed' in summary
+    assert summary[summary.index('failures:') + 1:summary.index('failures:') + 3] == [
+        '  RuntimeError: hash2', '  ValueError: hash3']
+
+    slowest = summary[summary.index('slowest 2 specs:') + 1:]
+    assert [line.split()[0] for line in slowest] == ['hash1', 'hash2']
+    assert '50.0 ms' in slowest[0]
+
+
+def test_summary_without_records():
+    assert journal.summarize([]) == '0 builds'
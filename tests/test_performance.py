@@ -0,0 +1,37 @@
+import time
+import tracemalloc
+
+import pytest
+
+from performance_budgets import ALL_SIZES, BUDGETS, build, spec_class
+
+ids = lambda size: size.designation
+
+
+@pytest.mark.parametrize('size', ALL_SIZES, ids=ids)
+def test_triangle_budget(size):
+    assert build(size).triangle_count <= BUDGETS[spec_class(size)]['triangles']
+
+
+@pytest.mark.parametrize('size', ALL_SIZES, ids=ids)
+def test_latency_budget(size):
+    # The best of a few runs keeps a busy machine from failing the budget.
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        build(size)
+        best = min(best, time.perf_counter() - start)
+
+    assert best * 1000 <= BUDGETS[spec_class(size)]['latency_ms']
+
+
+@pytest.mark.parametrize('size', ALL_SIZES, ids=ids)
+def test_memory_budget(size):
+    tracemalloc.start()
+    try:
+        build(size)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak / 1024 <= BUDGETS[spec_class(size)]['peak_kib']
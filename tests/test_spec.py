@@ -0,0 +1,82 @@
+import pytest
+
+from boltgeometry import mesh, spec, thread_table
+from mesh_checks import open_edges
+
+SPEC = {
+    'boltName': 'Printable Bolt',
+    'headDiameter': 1.6,
+    'headHeight': 0.5,
+    'headSides': 6,
+    'headProfile': 'Polygon',
+    'bodyDiameter': 1.0,
+    'bodyLength': 2.0,
+    'chamferDistance': 0.04,
+    'filletRadius': 0.03,
+    'backlash': 0.01,
+    'buildMode': 'direct',
+    'pitch': None,
+    'threadStarts': 1,
+    'threadAngle': 60.0,
+}
+
+
+def test_hash_ignores_names_and_parameters():
+    renamed = dict(SPEC, boltName='M10', parameters={'bodyDiameter': 'PrintableBolt1_bodyDiameter'})
+
+    assert spec.spec_hash(renamed) == spec.spec_hash(SPEC)
+    assert spec.spec_hash(dict(SPEC, bodyDiameter=1.0 + 1e-12)) == spec.spec_hash(SPEC)
+    assert spec.spec_hash(dict(SPEC, threadStarts=2)) != spec.spec_hash(SPEC)
+
+
+@pytest.mark.parametrize('changes, recommended', [
+    ({}, True),
+    ({'pitch': 0.125}, False),
+    ({'threadStarts': 2}, False),
+    ({'threadAngle': 55.0}, False),
+])
+def test_recommended_thread(changes, recommended):
+    assert spec.is_recommended_thread(dict(SPEC, **changes)) == recommended
+
+
+def test_specs_without_thread_fields_use_the_recommended_thread():
+    legacy = {key: value for key, value in SPEC.items() if key not in ('pitch', 'threadStarts', 'threadAngle')}
+
+    assert spec.is_recommended_thread(legacy)
+    assert spec.thread_pitch(legacy) == thread_table.nearest_thread(1.0).pitch
+
+
+def test_thread_mesh_follows_the_spec():
+    custom = dict(SPEC, pitch=0.2, threadStarts=2, threadAngle=90.0)
+    ridges = spec.thread_mesh(custom)
+    expected = mesh.thread(1.0, 0.2, 2.0, -2.0, 0.01, 90.0, 2, mesh.EXPORT_THREAD_SEGMENTS)
+
+    assert ridges.coordinates == expected.coordinates
+    assert ridges.indices == expected.indices
+    assert open_edges(ridges) == []
+
+
+def test_thread_triangle_count_follows_the_spec():
+    custom = dict(SPEC, pitch=0.2, threadStarts=2, threadAngle=90.0)
+
+    assert spec.thread_triangle_count(custom) == spec.thread_mesh(custom).triangle_count
+
+
+def test_inch_specs_use_the_unified_coarse_pitch():
+    inch = dict(SPEC, bodyDiameter=0.25 * thread_table.INCH, threadStandard='English')
+
+    assert spec.is_recommended_thread(inch)
+    assert spec.thread_pitch(inch) == pytest.approx(thread_table.INCH / 20)
+
+
+@pytest.mark.parametrize('changes, standard', [
+    ({}, True),
+    ({'pitch': 0.125}, True),
+    ({'pitch': 0.125, 'threadStarts': 2}, False),
+    ({'threadAngle': 55.0}, False),
+    ({'pitch': 0.2}, False),
+    ({'bodyDiameter': 0.25 * thread_table.INCH, 'pitch': thread_table.INCH / 28, 'threadStandard': 'English'}, True),
+    ({'bodyDiameter': 0.25 * thread_table.INCH, 'threadStandard': 'English', 'threadStarts': 3}, False),
+])
+def test_standard_thread(changes, standard):
+    assert spec.is_standard_thread(dict(SPEC, **changes)) == standard
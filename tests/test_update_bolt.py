@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+import fake_adsk
+
+
+def bound_bolt(printable_bolt, design, **values):
+    # Returns a bolt and a component whose spec and thread look like a bolt built with user parameters.
+    bolt = printable_bolt.PrintableBolt(fake_adsk.mock.MagicMock(), fake_adsk.mock.MagicMock(activeProduct=design))
+    bolt.bodyDiameter = 0.5
+    bolt.headDiameter = 0.9
+    bolt.applySpec(values)
+
+    component = fake_adsk.Component(design)
+    spec = bolt.spec
+    spec['parameters'] = bolt.createParameters()
+    component.attributes.add(printable_bolt.SPEC_ATTRIBUTE_GROUP, printable_bolt.SPEC_ATTRIBUTE_NAME, json.dumps(spec))
+
+    threads = component.features.threadFeatures
+    threadData = bolt.resolveThreadData(component)
+    threads.add(threads.createInput([], threads.createThreadInfo(False, threadData['type'], threadData['designation'], threadData['class'])))
+    return bolt, component
+
+
+def test_create_parameters_binds_every_dimension(printable_bolt):
+    design = fake_adsk.Design()
+    bolt, _ = bound_bolt(printable_bolt, design)
+
+    assert set(design.userParameters) == {f'PrintableBolt1_{name}' for name in printable_bolt.PARAMETER_NAMES}
+    assert design.userParameters['PrintableBolt1_bodyDiameter'].value == pytest.approx(0.5)
+
+
+def test_update_only_writes_changed_parameters(printable_bolt):
+    design = fake_adsk.Design()
+    bolt, component = bound_bolt(printable_bolt, design)
+    bolt.bodyLength = fake_adsk.ValueInput.createByReal(3.0)
+
+    changed = bolt.updateBolt(component)
+
+    assert changed == ['bodyLength']
+    assert {name: parameter.writes for name, parameter in design.userParameters.items() if parameter.writes} == {
+        'PrintableBolt1_bodyLength': 1}
+    assert printable_bolt.readSpec(component)['bodyLength'] == pytest.approx(3.0)
+    assert component.features.threadFeatures[0].threadInfo[1] == 'M5x0.8'
+
+
+def test_update_picks_the_thread_of_the_new_diameter(printable_bolt):
+    design = fake_adsk.Design()
+    bolt, component = bound_bolt(printable_bolt, design)
+    bolt.bodyDiameter = 0.6
+
+    assert bolt.updateBolt(component) == ['bodyDiameter']
+    assert component.features.threadFeatures[0].threadInfo[1] == 'M6x1'
+
+
+def test_update_keeps_a_pitch_override_the_new_diameter_has(printable_bolt):
+    design = fake_adsk.Design()
+    bolt, component = bound_bolt(printable_bolt, design, pitch=0.05)
+    assert component.features.threadFeatures[0].threadInfo[1] == 'M5x0.5'
+    bolt.bodyDiameter = 0.6
+
+    assert bolt.updateBolt(component) == ['bodyDiameter']
+    assert component.features.threadFeatures[0].threadInfo[1] == 'M6x0.5'
+    assert printable_bolt.readSpec(component)['pitch'] == pytest.approx(0.05)
+
+
+def test_update_falls_back_to_the_recommended_thread(printable_bolt):
+    design = fake_adsk.Design()
+    bolt, component = bound_bolt(printable_bolt, design, pitch=0.035)
+    assert component.features.threadFeatures[0].threadInfo[1] == 'M5x0.35'
+    bolt.bodyDiameter = 0.6
+
+    assert bolt.updateBolt(component) == ['bodyDiameter', 'pitch']
+    assert component.features.threadFeatures[0].threadInfo[1] == 'M6x1'
+    assert printable_bolt.readSpec(component)['pitch'] is None
+
+
+def test_bolts_after_a_mesh_thread_bolt_get_a_new_index(printable_bolt):
+    design = fake_adsk.Design()
+    app = fake_adsk.mock.MagicMock(activeProduct=design)
+
+    custom = printable_bolt.PrintableBolt(fake_adsk.mock.MagicMock(), app)
+    custom.applySpec({'bodyDiameter': 0.5, 'headDiameter': 0.9, 'pitch': 0.1, 'threadStarts': 2})
+    custom.buildMode = printable_bolt.BUILD_MODE_PARAMETRIC
+    custom.useParameters = True
+    assert custom.buildBolt() is not None
+
+    standard = printable_bolt.PrintableBolt(fake_adsk.mock.MagicMock(), app)
+    standard.applySpec({'bodyDiameter': 0.5, 'headDiameter': 0.9})
+    standard.buildMode = printable_bolt.BUILD_MODE_PARAMETRIC
+    standard.useParameters = True
+    assert standard.buildBolt() is not None
+
+    custom.ui.messageBox.assert_not_called()
+    standard.ui.messageBox.assert_not_called()
+    assert sorted(design.userParameters) == [
+        'PrintableBolt1_headDiameter', 'PrintableBolt1_headHeight',
+        'PrintableBolt2_backlash', 'PrintableBolt2_bodyDiameter', 'PrintableBolt2_bodyLength',
+        'PrintableBolt2_headDiameter', 'PrintableBolt2_headHeight',
+    ]